@@ -1,8 +1,35 @@
-import openai
-import boto3
-import json
+import asyncio
+import contextlib
 from abc import ABC, abstractmethod
-from typing import List, Dict, Union, Optional
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncContextManager,
+    Callable,
+    Iterator,
+    List,
+    Dict,
+    Tuple,
+    Type,
+    Union,
+    Optional,
+)
+from .llm_cache import LLMCache
+from ..utils import fastjson
+
+
+# Connection pool size shared by the provider HTTP clients. Sized well above
+# the default (10) so concurrent requests don't queue for a connection.
+MAX_POOL_CONNECTIONS = 64
+
+# Bedrock request defaults, used unless a caller overrides them
+BEDROCK_ANTHROPIC_VERSION = "bedrock-2023-05-31"
+BEDROCK_DEFAULT_MAX_TOKENS = 4096
+BEDROCK_DEFAULT_TEMPERATURE = 0.7
+
+# Most cache_control breakpoints Anthropic accepts in one request
+ANTHROPIC_MAX_CACHE_BREAKPOINTS = 4
 
 
 class LLMProvider(ABC):
@@ -10,14 +37,92 @@ class LLMProvider(ABC):
     Abstract base class for LLM providers.
     """
 
+    # Model identifier, used to key cached responses
+    model: Optional[str] = None
+
+    # Whether the provider marks prompt-cache breakpoints itself and wants
+    # the static part of the final message as a separate content block
+    prompt_caching: bool = False
+
     @abstractmethod
     def __init__(self, api_key: str, base_url: str = None):
         pass
 
+    def effective_temperature(self, **kwargs) -> Optional[float]:
+        """
+        Sampling temperature a request with these arguments is sent with.
+
+        Returns:
+            The temperature, or None if the provider leaves it to the server
+            and it is unknown
+        """
+        return None
+
     @abstractmethod
     def generate_response(self, prompt: Union[str, List[Dict[str, str]]], **kwargs):
         pass
 
+    def generate_response_stream(
+        self, prompt: Union[str, List[Dict[str, str]]], **kwargs
+    ) -> Iterator[str]:
+        """
+        Yield the response text incrementally as it is generated.
+
+        Providers without streaming support yield the full response once.
+        """
+        yield self.generate_response(prompt, **kwargs)
+
+    async def agenerate_response(
+        self, prompt: Union[str, List[Dict[str, str]]], **kwargs
+    ) -> str:
+        """
+        Async variant of generate_response.
+
+        Providers without a native async client fall back to running the
+        blocking call in a worker thread so concurrent requests still overlap.
+        """
+        return await asyncio.to_thread(self.generate_response, prompt, **kwargs)
+
+    def _async_session(self) -> AsyncContextManager[None]:
+        """
+        Scope of one batch on its event loop.
+
+        Providers with an async client open it here, so its connections
+        belong to the loop that uses them and are closed with it.
+        """
+        return contextlib.nullcontext()
+
+    def generate_batch(
+        self,
+        prompts: List[Union[str, List[Dict[str, str]]]],
+        max_concurrency: int = 10,
+        **kwargs,
+    ) -> List[str]:
+        """
+        Generate responses for several prompts concurrently.
+
+        Args:
+            prompts: Prompts in any format accepted by generate_response
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            Responses in the same order as prompts
+        """
+
+        async def _run() -> List[str]:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def _bounded(prompt):
+                async with semaphore:
+                    return await self.agenerate_response(prompt, **kwargs)
+
+            # Every batch runs on a new event loop, so async clients are
+            # opened and closed per batch rather than kept on the provider
+            async with self._async_session():
+                return await asyncio.gather(*(_bounded(p) for p in prompts))
+
+        return asyncio.run(_run())
+
 
 class OpenAIProvider(LLMProvider):
     """
@@ -30,10 +135,54 @@ class OpenAIProvider(LLMProvider):
         self.api_key = api_key
         self.base_url = base_url
         self.model = model
+
+        # Imported here so Bedrock-only deployments never load the OpenAI SDK
+        import httpx
+        import openai
+
+        self._limits = httpx.Limits(
+            max_connections=MAX_POOL_CONNECTIONS,
+            max_keepalive_connections=MAX_POOL_CONNECTIONS,
+        )
+        self._client_kwargs = {"api_key": self.api_key}
         if base_url:
-            self.client = openai.OpenAI(api_key=self.api_key, base_url=self.base_url)
-        else:
-            self.client = openai.OpenAI(api_key=self.api_key)
+            self._client_kwargs["base_url"] = self.base_url
+
+        self.client = openai.OpenAI(
+            http_client=openai.DefaultHttpxClient(limits=self._limits),
+            **self._client_kwargs,
+        )
+        # Async client of the batch running in the current context. httpx
+        # async connections are bound to the event loop that opened them, so
+        # one client cannot be shared between generate_batch calls
+        self._aclient: ContextVar[Optional["openai.AsyncOpenAI"]] = ContextVar(
+            "openai_async_client", default=None
+        )
+
+    @contextlib.asynccontextmanager
+    async def _async_session(self):
+        import openai
+
+        client = openai.AsyncOpenAI(
+            http_client=openai.DefaultAsyncHttpxClient(limits=self._limits),
+            **self._client_kwargs,
+        )
+        token = self._aclient.set(client)
+        try:
+            yield
+        finally:
+            self._aclient.reset(token)
+            await client.close()
+
+    @staticmethod
+    def _sampling_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Sampling arguments to forward; unset ones use the server default."""
+        if kwargs.get("temperature") is None:
+            return {}
+        return {"temperature": kwargs["temperature"]}
+
+    def effective_temperature(self, **kwargs) -> Optional[float]:
+        return kwargs.get("temperature")
 
     def generate_response(self, prompt: Union[str, List[Dict[str, str]]], **kwargs):
         # Support both old string format and new messages format
@@ -45,9 +194,105 @@ class OpenAIProvider(LLMProvider):
         completion = self.client.chat.completions.create(
             model=self.model,
             messages=messages,
+            **self._sampling_kwargs(kwargs),
         )
         return completion.choices[0].message.content
 
+    def generate_response_stream(
+        self, prompt: Union[str, List[Dict[str, str]]], **kwargs
+    ) -> Iterator[str]:
+        if isinstance(prompt, str):
+            messages = [{"role": "user", "content": prompt}]
+        else:
+            messages = prompt
+
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            stream=True,
+            **self._sampling_kwargs(kwargs),
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def agenerate_response(
+        self, prompt: Union[str, List[Dict[str, str]]], **kwargs
+    ) -> str:
+        if isinstance(prompt, str):
+            messages = [{"role": "user", "content": prompt}]
+        else:
+            messages = prompt
+
+        client = self._aclient.get()
+        if client is None:
+            # Called outside a batch: use a client scoped to this call
+            async with self._async_session():
+                return await self.agenerate_response(prompt, **kwargs)
+
+        completion = await client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            **self._sampling_kwargs(kwargs),
+        )
+        return completion.choices[0].message.content
+
+
+@lru_cache(maxsize=None)
+def _bedrock_client(
+    region: str,
+    access_key_id: Optional[str] = None,
+    secret_access_key: Optional[str] = None,
+):
+    """
+    Return a shared bedrock-runtime client for the given region and credentials.
+
+    boto3 clients are thread-safe, so providers created with the same settings
+    share one client and its keep-alive connection pool.
+    """
+    # Imported here so OpenAI-only deployments never load boto3
+    import boto3
+    from botocore.config import Config
+
+    # Initialize boto3 client with explicit credentials if provided
+    # Otherwise, boto3 will use default credential chain (env vars, ~/.aws/credentials, IAM role)
+    client_kwargs = {
+        "service_name": "bedrock-runtime",
+        "region_name": region,
+        "config": Config(
+            max_pool_connections=MAX_POOL_CONNECTIONS,
+            retries={"max_attempts": 5, "mode": "adaptive"},
+            tcp_keepalive=True,
+            read_timeout=60,
+            connect_timeout=5,
+        ),
+    }
+
+    if access_key_id and secret_access_key:
+        client_kwargs["aws_access_key_id"] = access_key_id
+        client_kwargs["aws_secret_access_key"] = secret_access_key
+
+    return boto3.client(**client_kwargs)
+
+
+@lru_cache(maxsize=32)
+def _fuse_system_prompts(parts: Tuple[str, ...]) -> str:
+    """Combine system messages once per distinct set of system prompts."""
+    return "\n\n".join(parts)
+
+
+@lru_cache(maxsize=32)
+def _cached_text_block(text: str) -> Dict[str, Any]:
+    """Text content block marked as a prompt-cache breakpoint."""
+    return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+
+
+@lru_cache(maxsize=32)
+def _serialized_system_field(system_prompt: str, prompt_caching: bool) -> bytes:
+    """Pre-serialized ``,"system":...`` member for the Bedrock request body."""
+    system = [_cached_text_block(system_prompt)] if prompt_caching else system_prompt
+    return b',"system":' + fastjson.dumps(system)
+
 
 class BedrockProvider(LLMProvider):
     """
@@ -62,26 +307,44 @@ class BedrockProvider(LLMProvider):
         inference_profile: str,
         access_key_id: Optional[str] = None,
         secret_access_key: Optional[str] = None,
+        latency_optimized: bool = False,
+        prompt_caching: bool = False,
+        max_cache_breakpoints: int = ANTHROPIC_MAX_CACHE_BREAKPOINTS,
     ):
         if not inference_profile:
             raise ValueError("inference_profile parameter is required")
 
         self.inference_profile = inference_profile
+        self.model = inference_profile
+        # Route requests to the latency-optimized backend (supported models only)
+        self.latency_optimized = latency_optimized
+        # Mark the static prompt prefix as cacheable (Anthropic prompt caching)
+        self.prompt_caching = prompt_caching
+        # Breakpoints are placed in prefix order (system, few-shot examples,
+        # instructions, ticket) until this many are used
+        self.max_cache_breakpoints = max_cache_breakpoints
 
-        # Initialize boto3 client with explicit credentials if provided
-        # Otherwise, boto3 will use default credential chain (env vars, ~/.aws/credentials, IAM role)
-        client_kwargs = {
-            "service_name": "bedrock-runtime",
-            "region_name": region,
-        }
+        # Body prefix for requests that use the default sampling parameters;
+        # only the messages (and system prompt) are serialized per call.
+        self._default_body_prefix = (
+            b'{"anthropic_version":'
+            + fastjson.dumps(BEDROCK_ANTHROPIC_VERSION)
+            + b',"max_tokens":'
+            + fastjson.dumps(BEDROCK_DEFAULT_MAX_TOKENS)
+            + b',"temperature":'
+            + fastjson.dumps(BEDROCK_DEFAULT_TEMPERATURE)
+            + b',"messages":'
+        )
 
-        if access_key_id and secret_access_key:
-            client_kwargs["aws_access_key_id"] = access_key_id
-            client_kwargs["aws_secret_access_key"] = secret_access_key
+        self.client = _bedrock_client(region, access_key_id, secret_access_key)
 
-        self.client = boto3.client(**client_kwargs)
+    def effective_temperature(self, **kwargs) -> Optional[float]:
+        return kwargs.get("temperature", BEDROCK_DEFAULT_TEMPERATURE)
 
-    def generate_response(self, prompt: Union[str, List[Dict[str, str]]], **kwargs):
+    def _build_invoke_kwargs(
+        self, prompt: Union[str, List[Dict[str, str]]], **kwargs
+    ) -> Dict[str, Any]:
+        """Build the invoke_model / invoke_model_with_response_stream arguments."""
         # Support both old string format and new messages format
         if isinstance(prompt, str):
             messages = [{"role": "user", "content": prompt}]
@@ -89,52 +352,300 @@ class BedrockProvider(LLMProvider):
             messages = prompt
 
         # Extract system message if present (Bedrock requires it as separate parameter)
-        system_prompt = None
+        system_parts = []
         filtered_messages = []
         for msg in messages:
             if msg.get("role") == "system":
-                # Combine multiple system messages if present
-                if system_prompt is None:
-                    system_prompt = msg.get("content", "")
-                else:
-                    system_prompt += "\n\n" + msg.get("content", "")
+                system_parts.append(msg.get("content", ""))
             else:
                 filtered_messages.append(msg)
 
-        # For Claude models on Bedrock, use the Messages API format
-        body = {
-            "anthropic_version": "bedrock-2023-05-31",
-            "messages": filtered_messages,
-            "max_tokens": kwargs.get("max_tokens", 4096),
-            "temperature": kwargs.get("temperature", 0.7),
-        }
+        system_prompt = (
+            _fuse_system_prompts(tuple(system_parts)) if system_parts else ""
+        )
+
+        breakpoints = self.max_cache_breakpoints if self.prompt_caching else 0
+        cache_system = bool(system_prompt) and breakpoints > 0
+        if cache_system:
+            breakpoints -= 1
 
-        # Add system prompt if present
-        if system_prompt:
-            body["system"] = system_prompt
+        # Mark the end of the static conversation prefix (the few-shot
+        # examples before the final ticket message) as a cache breakpoint
+        if breakpoints > 0 and len(filtered_messages) > 1:
+            prefix_end = filtered_messages[-2]
+            if isinstance(prefix_end.get("content"), str):
+                filtered_messages[-2] = {
+                    **prefix_end,
+                    "content": [_cached_text_block(prefix_end["content"])],
+                }
+                breakpoints -= 1
 
+        # When the final message is split into blocks (instructions, ticket,
+        # then retrieval results), extend the cached prefix through every
+        # block but the last, as far as the remaining breakpoints allow
+        if breakpoints > 0 and filtered_messages:
+            last = filtered_messages[-1]
+            blocks = last.get("content")
+            if isinstance(blocks, list) and len(blocks) > 1:
+                cached = min(len(blocks) - 1, breakpoints)
+                filtered_messages[-1] = {
+                    **last,
+                    "content": [
+                        *(
+                            _cached_text_block(block["text"])
+                            for block in blocks[:cached]
+                        ),
+                        *blocks[cached:],
+                    ],
+                }
+        max_tokens = kwargs.get("max_tokens", BEDROCK_DEFAULT_MAX_TOKENS)
+        temperature = kwargs.get("temperature", BEDROCK_DEFAULT_TEMPERATURE)
+
+        if (
+            max_tokens == BEDROCK_DEFAULT_MAX_TOKENS
+            and temperature == BEDROCK_DEFAULT_TEMPERATURE
+        ):
+            # Fast path: splice the messages into the pre-serialized prefix
+            body_bytes = self._default_body_prefix + fastjson.dumps(filtered_messages)
+            if system_prompt:
+                body_bytes += _serialized_system_field(system_prompt, cache_system)
+            body_bytes += b"}"
+        else:
+            # For Claude models on Bedrock, use the Messages API format
+            body = {
+                "anthropic_version": BEDROCK_ANTHROPIC_VERSION,
+                "messages": filtered_messages,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+            }
+
+            # Add system prompt if present, combining multiple system messages
+            if system_prompt:
+                body["system"] = (
+                    [_cached_text_block(system_prompt)]
+                    if cache_system
+                    else system_prompt
+                )
+            body_bytes = fastjson.dumps(body)
+
+        invoke_kwargs = {
+            "modelId": self.inference_profile,
+            "body": body_bytes,
+            "accept": "application/json",
+            "contentType": "application/json",
+        }
+        if self.latency_optimized:
+            invoke_kwargs["performanceConfigLatency"] = "optimized"
+        return invoke_kwargs
+
+    def generate_response(self, prompt: Union[str, List[Dict[str, str]]], **kwargs):
         # Invoke the model using the inference profile
         response = self.client.invoke_model(
-            modelId=self.inference_profile,
-            body=json.dumps(body),
-            accept="application/json",
-            contentType="application/json",
+            **self._build_invoke_kwargs(prompt, **kwargs)
         )
 
         # Parse response
-        response_body = json.loads(response["body"].read())
+        response_body = fastjson.loads(response["body"].read())
 
         # Extract the generated text from Claude's response format
         return response_body["content"][0]["text"]
 
+    def generate_response_stream(
+        self, prompt: Union[str, List[Dict[str, str]]], **kwargs
+    ) -> Iterator[str]:
+        response = self.client.invoke_model_with_response_stream(
+            **self._build_invoke_kwargs(prompt, **kwargs)
+        )
+
+        for event in response["body"]:
+            chunk = event.get("chunk")
+            if not chunk:
+                continue
+            payload = fastjson.loads(chunk["bytes"])
+            if payload.get("type") == "content_block_delta":
+                text = payload.get("delta", {}).get("text")
+                if text:
+                    yield text
+
+
+@lru_cache(maxsize=8)
+def get_provider(provider_cls: Type[LLMProvider], **kwargs: Any) -> LLMProvider:
+    """
+    Return a shared provider instance for the given class and settings.
+
+    Building a provider resolves credentials and endpoints and sets up an
+    HTTP client, so agents created with the same settings in one process
+    reuse the first instance. Providers hold no per-request state.
+
+    Args:
+        provider_cls: Provider class, e.g. OpenAIProvider or BedrockProvider
+        **kwargs: Constructor arguments; all values must be hashable
+
+    Returns:
+        The cached or newly built provider
+    """
+    return provider_cls(**kwargs)
+
 
 class LLM:
     """
     LLM class for interacting with different LLM providers.
     """
 
-    def __init__(self, provider: LLMProvider):
+    def __init__(self, provider: LLMProvider, cache: Optional[LLMCache] = None):
         self.provider = provider
+        self.cache = cache
+
+    @property
+    def prompt_caching(self) -> bool:
+        """Whether prompts should be formatted with content_blocks=True."""
+        return self.provider.prompt_caching
+
+    @property
+    def deterministic_kwargs(self) -> Dict[str, Any]:
+        """
+        Sampling arguments for calls whose answer should not vary.
+
+        With a response cache, these calls are sent at temperature 0 so their
+        responses can be cached and replayed; without one, the provider
+        default is kept.
+        """
+        return {"temperature": 0} if self.cache is not None else {}
+
+    def _cache_key(
+        self, prompt: Union[str, List[Dict[str, str]]], **kwargs
+    ) -> Optional[str]:
+        if self.cache is None:
+            return None
+        return self.cache.cache_key(
+            self.provider.model,
+            prompt,
+            temperature=self.provider.effective_temperature(**kwargs),
+            tools=kwargs.get("tools"),
+        )
 
     def generate_response(self, prompt: Union[str, List[Dict[str, str]]], **kwargs):
-        return self.provider.generate_response(prompt, **kwargs)
+        key = self._cache_key(prompt, **kwargs)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        response = self.provider.generate_response(prompt, **kwargs)
+
+        if key is not None and response is not None:
+            self.cache.set(key, response)
+        return response
+
+    def generate_response_stream(
+        self, prompt: Union[str, List[Dict[str, str]]], **kwargs
+    ) -> Iterator[str]:
+        key = self._cache_key(prompt, **kwargs)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                yield cached
+                return
+
+        parts = []
+        for text in self.provider.generate_response_stream(prompt, **kwargs):
+            parts.append(text)
+            yield text
+
+        if key is not None:
+            self.cache.set(key, "".join(parts))
+
+    async def agenerate_response(
+        self, prompt: Union[str, List[Dict[str, str]]], **kwargs
+    ) -> str:
+        key = self._cache_key(prompt, **kwargs)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        response = await self.provider.agenerate_response(prompt, **kwargs)
+
+        if key is not None and response is not None:
+            self.cache.set(key, response)
+        return response
+
+    def generate_batch(
+        self,
+        prompts: List[Union[str, List[Dict[str, str]]]],
+        max_concurrency: int = 10,
+        **kwargs,
+    ) -> List[str]:
+        keys = [self._cache_key(p, **kwargs) for p in prompts]
+        responses: List[Optional[str]] = [
+            self.cache.get(k) if k is not None else None for k in keys
+        ]
+
+        # Only send the prompts that missed the cache
+        misses = [i for i, r in enumerate(responses) if r is None]
+        if misses:
+            generated = self.provider.generate_batch(
+                [prompts[i] for i in misses],
+                max_concurrency=max_concurrency,
+                **kwargs,
+            )
+            for i, response in zip(misses, generated):
+                responses[i] = response
+                if keys[i] is not None and response is not None:
+                    self.cache.set(keys[i], response)
+
+        return responses
+
+    def generate_batched(
+        self,
+        items: List[Any],
+        render_one: Callable[[Any], str],
+        parse_many: Optional[Callable[[str], List[Any]]] = None,
+        batch_size: int = 8,
+        max_concurrency: int = 10,
+        **kwargs,
+    ) -> List[Any]:
+        """
+        Answer many small prompts by packing several items into each request.
+
+        Items are grouped into chunks of batch_size; each chunk becomes one
+        prompt asking for a JSON array with one answer per item. Chunks are
+        sent concurrently via generate_batch.
+
+        Args:
+            items: Items to answer
+            render_one: Renders a single item as prompt text
+            parse_many: Splits a chunk response into per-item answers
+                        (default: parse the response as a JSON array)
+            batch_size: Number of items packed into each request
+            max_concurrency: Maximum number of chunk requests in flight
+
+        Returns:
+            Answers in the same order as items
+        """
+        parse_many = parse_many or fastjson.loads
+        chunks = [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+
+        prompts = []
+        for chunk in chunks:
+            lines = [
+                f"Answer each of the following {len(chunk)} items. Return ONLY a "
+                "JSON array with exactly one answer per item, in the same order. "
+                "Do not include markdown or any extra text."
+            ]
+            lines.extend(f"[{i}] {render_one(item)}" for i, item in enumerate(chunk))
+            prompts.append("\n".join(lines))
+
+        responses = self.generate_batch(
+            prompts, max_concurrency=max_concurrency, **kwargs
+        )
+
+        answers: List[Any] = []
+        for chunk, response in zip(chunks, responses):
+            parsed = parse_many(response)
+            if not isinstance(parsed, list) or len(parsed) != len(chunk):
+                raise ValueError(
+                    f"Expected a list of {len(chunk)} answers, got: {response!r}"
+                )
+            answers.extend(parsed)
+        return answers
@@ -0,0 +1,64 @@
+"""Response caching for deterministic LLM requests."""
+
+import hashlib
+from typing import Any, Dict, List, Optional, Union
+from ..utils import fastjson
+from ..utils.cache import DiskBackend, MemoryBackend
+
+
+class LLMCache:
+    """
+    Cache of LLM responses keyed by a SHA-256 hash of the request.
+
+    Only deterministic requests are cached: a request sampled at a positive
+    or unknown temperature produces no cache key and always reaches the
+    provider.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[Union[MemoryBackend, DiskBackend]] = None,
+        ttl: Optional[float] = None,
+    ):
+        self.backend = backend or MemoryBackend()
+        self.ttl = ttl
+
+    @staticmethod
+    def cache_key(
+        model: Optional[str],
+        messages: Union[str, List[Dict[str, Any]]],
+        temperature: Optional[float] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> Optional[str]:
+        """
+        Build the cache key for a request.
+
+        Args:
+            model: Model or inference profile identifier
+            messages: Prompt string or messages array sent to the provider
+            temperature: Effective sampling temperature (None = unknown
+                server default)
+            tools: Optional tool definitions sent with the request
+
+        Returns:
+            Hex digest identifying the request, or None if it is not cacheable
+        """
+        if temperature is None or temperature > 0:
+            return None
+
+        payload = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "tools": tools,
+        }
+        return hashlib.sha256(fastjson.dumps(payload, sort_keys=True)).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        return self.backend.get(key)
+
+    def set(self, key: str, value: str) -> None:
+        self.backend.set(key, value, ttl=self.ttl)
+
+    def clear(self) -> None:
+        self.backend.clear()
@@ -1,3 +1,11 @@
-from . import jira, confluence
+import importlib
 
 __all__ = ["jira", "confluence"]
+
+
+def __getattr__(name):
+    # Import each client module on first access, so using one service doesn't
+    # load the other's SDK
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
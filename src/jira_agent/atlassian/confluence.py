@@ -1,11 +1,29 @@
+import logging
 from atlassian import Confluence
-from pprint import pprint
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
+from ..utils import fastjson
+from ..utils.cache import DiskBackend, MemoryBackend
+from ..utils.http import pooled_session
+from ..utils.retry import status_code, retry_transient
+
+
+logger = logging.getLogger(__name__)
+
+# CQL search expansion that inlines each hit's body and version
+_BODY_EXPAND = "content.body.storage,content.version"
 
 
 class Client:
     def __init__(
-        self, server: str, email: str, token: str, space_key: Optional[str] = None
+        self,
+        server: str,
+        email: str,
+        token: str,
+        space_key: Optional[str] = None,
+        cache_ttl: float = 60,
+        page_cache_ttl: Optional[float] = None,
+        persistent_cache: Optional[DiskBackend] = None,
     ):
         """
         Initialize Confluence client.
@@ -15,18 +33,137 @@ class Client:
             email: User email for authentication
             token: API token for authentication
             space_key: Optional default space key to search within
+            cache_ttl: Seconds to reuse search results (0 disables caching)
+            page_cache_ttl: Seconds to reuse page content fetched by ID
+                (None = cache_ttl, 0 disables); pages this client updates
+                are dropped from the cache immediately
+            persistent_cache: Optional on-disk second tier, so cached results
+                survive restarts and are shared by processes using the same file
         """
         self.server = server
         self.email = email
         self.token = token
         self.space_key = space_key
+        self.cache_ttl = cache_ttl
+        self.page_cache_ttl = cache_ttl if page_cache_ttl is None else page_cache_ttl
+        self._wiki_base = f"{self.server}/wiki"
+        self._page_cache = MemoryBackend(maxsize=1024)
+        self._cql_cache = MemoryBackend(maxsize=512)
+        self._disk_cache = persistent_cache
         self.confluence = Confluence(
             url=self.server,
             username=self.email,
             password=self.token,
             cloud=True,  # Set to True for Atlassian Cloud, False for Server
+            session=pooled_session(),
         )
 
+    def _disk_key(self, cache: MemoryBackend, key: str) -> str:
+        """Namespace a key for the shared on-disk table."""
+        return ("page:" if cache is self._page_cache else "cql:") + key
+
+    def _ttl(self, cache: MemoryBackend) -> float:
+        """Lifetime of entries in the given cache."""
+        return self.page_cache_ttl if cache is self._page_cache else self.cache_ttl
+
+    def _cache_get(self, cache: MemoryBackend, key: str) -> Optional[Any]:
+        """Return a copy of a cached result, or None on a miss."""
+        ttl = self._ttl(cache)
+        if ttl <= 0:
+            return None
+        value = cache.get(key)
+        if value is None and self._disk_cache is not None:
+            stored = self._disk_cache.get(self._disk_key(cache, key))
+            if stored is not None:
+                value = fastjson.loads(stored)
+                cache.set(key, value, ttl=ttl)
+        return _copy_result(value)
+
+    def _cache_set(self, cache: MemoryBackend, key: str, value: Any) -> None:
+        """Cache a copy of a result so callers can mutate what they receive."""
+        ttl = self._ttl(cache)
+        if ttl > 0:
+            cache.set(key, _copy_result(value), ttl=ttl)
+            if self._disk_cache is not None:
+                self._disk_cache.set(
+                    self._disk_key(cache, key),
+                    fastjson.dumps(value),
+                    ttl=ttl,
+                )
+
+    def _space_clause(self, space_key: Optional[str]) -> str:
+        """Return the CQL space restriction, or an empty string for all spaces."""
+        space = space_key or self.space_key
+        return f' AND space="{space}"' if space else ""
+
+    def _page_url(self, page: Dict[str, Any]) -> str:
+        """Build the web UI URL for a page from its _links block."""
+        return self._wiki_base + page.get("_links", {}).get("webui", "")
+
+    def _article_from_content(self, content: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Reduce a CQL result's content block to the article summary dict.
+
+        When the search expanded the body, "content" and "version" are added.
+        Only a body the search actually returned is reported, so callers never
+        mistake a missing expansion for an empty page.
+        """
+        article = {
+            "id": content.get("id"),
+            "title": content.get("title"),
+            "type": content.get("type"),
+            "space": content.get("space", {}).get("key"),
+            "url": self._page_url(content),
+        }
+        storage = content.get("body", {}).get("storage")
+        if storage is not None:
+            article["content"] = storage.get("value", "")
+            article["version"] = content.get("version", {}).get("number")
+        return article
+
+    @retry_transient()
+    def _cql(
+        self, cql: str, limit: int, expand: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Run a CQL search, retrying transient failures."""
+        return self.confluence.cql(cql, limit=limit, expand=expand)
+
+    @retry_transient()
+    def _get_page_by_id(self, page_id: str, expand: str) -> Dict[str, Any]:
+        """Fetch a page by ID, retrying transient failures."""
+        return self.confluence.get_page_by_id(page_id=page_id, expand=expand)
+
+    @retry_transient()
+    def _update_page(self, **kwargs) -> Dict[str, Any]:
+        """Update a page, retrying transient failures."""
+        return self.confluence.update_page(**kwargs)
+
+    @retry_transient()
+    def _put_page(self, page_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace a page with an explicit version, retrying transient failures."""
+        return self.confluence.put(f"rest/api/content/{page_id}", data=data)
+
+    def invalidate(self, page_id: Optional[str] = None) -> None:
+        """
+        Drop cached results affected by a page change.
+
+        Args:
+            page_id: Page whose cached content should be dropped (None = all pages)
+        """
+        if page_id is None:
+            self._page_cache.clear()
+        else:
+            self._page_cache.delete_prefix(f"{page_id}|")
+        # Titles and search hits may have changed, so drop all CQL results
+        self._cql_cache.clear()
+
+        if self._disk_cache is not None:
+            if page_id is None:
+                self._disk_cache.delete_prefix("page:")
+            else:
+                self._disk_cache.delete_prefix(f"page:{page_id}|")
+            self._disk_cache.delete_prefix("cql:")
+
     def test_connection(self):
         """Test the Confluence connection by getting current user info."""
         try:
@@ -35,11 +172,15 @@ class Client:
             _ = self.confluence.cql("type=page", limit=1)
             return True
         except Exception as e:
-            print(f"Failed to connect to Confluence: {e}")
+            logger.error("Failed to connect to Confluence: %s", e)
             return False
 
     def search_articles(
-        self, query: str, space_key: Optional[str] = None, limit: int = 10
+        self,
+        query: str,
+        space_key: Optional[str] = None,
+        limit: int = 10,
+        expand_body: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Search for articles using CQL (Confluence Query Language).
@@ -48,45 +189,47 @@ class Client:
             query: Search query text
             space_key: Space to search in (uses default if not provided)
             limit: Maximum number of results to return
+            expand_body: Also return each page's body and version from the
+                same search request, saving a get_page_content call per hit
 
         Returns:
-            List of search results with page information
+            List of search results with page information (plus "content" and
+            "version" for each hit whose body was expanded)
         """
         try:
-            search_space = space_key or self.space_key
-
-            # Build CQL query
             # Search both title and text to improve match rate
-            cql_parts = [f'(title ~ "{query}" OR text ~ "{query}")', "type=page"]
-            if search_space:
-                cql_parts.append(f'space="{search_space}"')
+            cql = (
+                f'(title ~ "{query}" OR text ~ "{query}") AND type=page'
+                f"{self._space_clause(space_key)}"
+            )
+
+            expand = _BODY_EXPAND if expand_body else None
 
-            cql = " AND ".join(cql_parts)
+            cache_key = f"{cql}|{limit}|{expand}"
+            cached = self._cache_get(self._cql_cache, cache_key)
+            if cached is not None:
+                return cached
 
-            results = self.confluence.cql(cql, limit=limit)
+            results = self._cql(cql, limit, expand=expand)
 
             # Extract relevant information from results
-            articles = []
-            for result in results.get("results", []):
-                content = result.get("content", {})
-                articles.append(
-                    {
-                        "id": content.get("id"),
-                        "title": content.get("title"),
-                        "type": content.get("type"),
-                        "space": content.get("space", {}).get("key"),
-                        "url": f"{self.server}/wiki{content.get('_links', {}).get('webui', '')}",
-                    }
-                )
+            articles = [
+                self._article_from_content(result.get("content", {}))
+                for result in results.get("results", [])
+            ]
 
+            self._cache_set(self._cql_cache, cache_key, articles)
             return articles
 
-        except Exception as e:
-            print(f"Error searching Confluence: {e}")
+        except Exception:
+            logger.exception("Error searching Confluence")
             return []
 
     def get_page_content(
-        self, page_id: str, expand: str = "body.storage,version"
+        self,
+        page_id: str,
+        expand: str = "body.storage,version",
+        use_cache: bool = True,
     ) -> Optional[Dict[str, Any]]:
         """
         Get full content of a specific Confluence page.
@@ -94,26 +237,82 @@ class Client:
         Args:
             page_id: The Confluence page ID
             expand: Fields to expand in the response
+            use_cache: Whether a cached copy may be returned; pass False when
+                the body is about to be edited and written back
 
         Returns:
             Dictionary containing page information and content
         """
         try:
-            page = self.confluence.get_page_by_id(page_id=page_id, expand=expand)
+            cache_key = f"{page_id}|{expand}"
+            if use_cache:
+                cached = self._cache_get(self._page_cache, cache_key)
+                if cached is not None:
+                    return cached
 
-            return {
+            page = self._get_page_by_id(page_id, expand)
+
+            page_content = {
                 "id": page.get("id"),
                 "title": page.get("title"),
                 "space": page.get("space", {}).get("key"),
                 "content": page.get("body", {}).get("storage", {}).get("value", ""),
                 "version": page.get("version", {}).get("number"),
-                "url": f"{self.server}/wiki{page.get('_links', {}).get('webui', '')}",
+                "url": self._page_url(page),
             }
+            self._cache_set(self._page_cache, cache_key, page_content)
+            return page_content
 
-        except Exception as e:
-            print(f"Error getting page content: {e}")
+        except Exception:
+            logger.exception("Error getting page content")
             return None
 
+    def get_pages_bulk(
+        self,
+        page_ids: List[str],
+        expand: str = "body.storage,version",
+        max_workers: int = 16,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch several pages concurrently.
+
+        Args:
+            page_ids: The Confluence page IDs to fetch
+            expand: Fields to expand in each response
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Page dictionaries in the same order as page_ids (None for failures)
+        """
+        if not page_ids:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(page_ids))) as ex:
+            return list(
+                ex.map(lambda pid: self.get_page_content(pid, expand), page_ids)
+            )
+
+    def search_then_fetch(
+        self, query: str, space_key: Optional[str] = None, limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for articles and fetch their content in parallel.
+
+        Args:
+            query: Search query text
+            space_key: Space to search in (uses default if not provided)
+            limit: Maximum number of results to return
+
+        Returns:
+            Search results with a "content" key holding each page body
+        """
+        articles = self.search_articles(query, space_key=space_key, limit=limit)
+        pages = self.get_pages_bulk([article["id"] for article in articles])
+
+        for article, page in zip(articles, pages):
+            article["content"] = page.get("content", "") if page else ""
+        return articles
+
     def search_by_label(
         self, label: str, space_key: Optional[str] = None, limit: int = 10
     ) -> List[Dict[str, Any]]:
@@ -129,33 +328,25 @@ class Client:
             List of pages with the specified label
         """
         try:
-            search_space = space_key or self.space_key
+            cql = f'label="{label}" AND type=page{self._space_clause(space_key)}'
 
-            cql_parts = [f'label="{label}"', "type=page"]
-            if search_space:
-                cql_parts.append(f'space="{search_space}"')
+            cache_key = f"{cql}|{limit}"
+            cached = self._cache_get(self._cql_cache, cache_key)
+            if cached is not None:
+                return cached
 
-            cql = " AND ".join(cql_parts)
+            results = self._cql(cql, limit)
 
-            results = self.confluence.cql(cql, limit=limit)
-
-            articles = []
-            for result in results.get("results", []):
-                content = result.get("content", {})
-                articles.append(
-                    {
-                        "id": content.get("id"),
-                        "title": content.get("title"),
-                        "type": content.get("type"),
-                        "space": content.get("space", {}).get("key"),
-                        "url": f"{self.server}/wiki{content.get('_links', {}).get('webui', '')}",
-                    }
-                )
+            articles = [
+                self._article_from_content(result.get("content", {}))
+                for result in results.get("results", [])
+            ]
 
+            self._cache_set(self._cql_cache, cache_key, articles)
             return articles
 
-        except Exception as e:
-            print(f"Error searching by label: {e}")
+        except Exception:
+            logger.exception("Error searching by label")
             return []
 
     def create_page(
@@ -182,7 +373,7 @@ class Client:
         try:
             target_space = space_key or self.space_key
             if not target_space:
-                print("Error: No space key provided or configured")
+                logger.error("No space key provided or configured")
                 return None
 
             # Create the page using the atlassian-python-api library
@@ -195,17 +386,18 @@ class Client:
                 type="page",
                 representation="storage",
             )
+            self.invalidate(page.get("id"))
 
             return {
                 "id": page.get("id"),
                 "title": page.get("title"),
                 "space": page.get("space", {}).get("key"),
-                "url": f"{self.server}/wiki{page.get('_links', {}).get('webui', '')}",
+                "url": self._page_url(page),
                 "version": page.get("version", {}).get("number"),
             }
 
-        except Exception as e:
-            print(f"Error creating Confluence page: {e}")
+        except Exception:
+            logger.exception("Error creating Confluence page")
             return None
 
     def update_page(
@@ -214,6 +406,7 @@ class Client:
         title: str,
         content: str,
         version_comment: Optional[str] = None,
+        version: Optional[int] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Update an existing Confluence page.
@@ -223,51 +416,73 @@ class Client:
             title: Page title (must match existing or be updated)
             content: New page content in Confluence storage format (HTML)
             version_comment: Optional comment describing the changes
+            version: Version the content was based on; when given, the update
+                is rejected if the page has changed since that version
 
         Returns:
             Dictionary with updated page information or None if failed
         """
+        message = version_comment or "Updated by JIRA Agent"
         try:
-            # Get current page to get version number
-            current_page = self.confluence.get_page_by_id(
-                page_id=page_id, expand="version"
-            )
-            if not current_page:
-                print(f"Error: Could not find page with ID {page_id}")
-                return None
-
-            current_version = current_page.get("version", {}).get("number", 1)
-
-            # Update the page
-            updated_page = self.confluence.update_page(
-                page_id=page_id,
-                title=title,
-                body=content,
-                parent_id=(
-                    current_page.get("ancestors", [{}])[-1].get("id")
-                    if current_page.get("ancestors")
-                    else None
-                ),
-                type="page",
-                representation="storage",
-                minor_edit=False,
-                version_comment=version_comment or "Updated by JIRA Agent",
-            )
+            if version is None:
+                # atlassian-python-api looks up the current version itself,
+                # and omitting parent_id keeps the page where it is, so no
+                # separate fetch of the current page is needed.
+                updated_page = self._update_page(
+                    page_id=page_id,
+                    title=title,
+                    body=content,
+                    type="page",
+                    representation="storage",
+                    minor_edit=False,
+                    version_comment=message,
+                )
+            else:
+                # Confluence answers 409 unless version + 1 is the next version
+                updated_page = self._put_page(
+                    page_id,
+                    {
+                        "id": page_id,
+                        "type": "page",
+                        "title": title,
+                        "body": {
+                            "storage": {"value": content, "representation": "storage"}
+                        },
+                        "version": {
+                            "number": version + 1,
+                            "minorEdit": False,
+                            "message": message,
+                        },
+                    },
+                )
+            self.invalidate(page_id)
 
             return {
                 "id": updated_page.get("id"),
                 "title": updated_page.get("title"),
                 "space": updated_page.get("space", {}).get("key"),
-                "url": f"{self.server}/wiki{updated_page.get('_links', {}).get('webui', '')}",
+                "url": self._page_url(updated_page),
                 "version": updated_page.get("version", {}).get("number"),
             }
 
         except Exception as e:
-            print(f"Error updating Confluence page: {e}")
+            if status_code(e) == 409:
+                logger.warning(
+                    "Page %s changed since version %s was read, not updating it",
+                    page_id,
+                    version,
+                )
+                self.invalidate(page_id)
+            else:
+                logger.exception("Error updating Confluence page")
             return None
 
     def find_page_by_title(
-        self, title: str, space_key: Optional[str] = None
+        self,
+        title: str,
+        space_key: Optional[str] = None,
+        expand_body: bool = False,
+        use_cache: bool = True,
     ) -> Optional[Dict[str, Any]]:
         """
         Find a page by its exact title.
@@ -275,32 +490,44 @@ class Client:
         Args:
             title: Exact page title to search for
             space_key: Space to search in (uses default if not provided)
+            expand_body: Also return the page body and version from the same
+                search request, saving a get_page_content round trip
+            use_cache: Whether a cached result may be returned; pass False when
+                the body is about to be edited and written back
 
         Returns:
-            Dictionary with page information or None if not found
+            Dictionary with page information (plus "content" and "version"
+            when the body was expanded) or None if not found
         """
         try:
-            target_space = space_key or self.space_key
+            cql = f'title="{title}" AND type=page{self._space_clause(space_key)}'
+            expand = _BODY_EXPAND if expand_body else None
 
-            cql_parts = [f'title="{title}"', "type=page"]
-            if target_space:
-                cql_parts.append(f'space="{target_space}"')
+            cache_key = f"{cql}|1|{expand}"
+            if use_cache:
+                cached = self._cache_get(self._cql_cache, cache_key)
+                if cached is not None:
+                    return cached
 
-            cql = " AND ".join(cql_parts)
-            results = self.confluence.cql(cql, limit=1)
+            results = self._cql(cql, 1, expand=expand)
 
             if results.get("results"):
                 content = results["results"][0].get("content", {})
-                return {
-                    "id": content.get("id"),
-                    "title": content.get("title"),
-                    "type": content.get("type"),
-                    "space": content.get("space", {}).get("key"),
-                    "url": f"{self.server}/wiki{content.get('_links', {}).get('webui', '')}",
-                }
+                page = self._article_from_content(content)
+                self._cache_set(self._cql_cache, cache_key, page)
+                return page
 
             return None
 
-        except Exception as e:
-            print(f"Error finding page by title: {e}")
+        except Exception:
+            logger.exception("Error finding page by title")
             return None
+
+
+def _copy_result(value: Any) -> Any:
+    """Shallow-copy a page dict or a list of page dicts."""
+    if isinstance(value, list):
+        return [dict(item) for item in value]
+    if isinstance(value, dict):
+        return dict(value)
+    return value
@@ -1,6 +1,36 @@
+import logging
 from jira import JIRA
-from pprint import pprint
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, NamedTuple, Optional
+from ..utils.http import mount_pooled_adapter
+
+
+# Fields consumed when rendering a ticket for the LLM
+FULL_TICKET_FIELDS = (
+    "summary,description,status,resolution,resolutiondate,comment,attachment,"
+    "issuetype,priority,reporter,assignee,created,updated,labels,components"
+)
+
+# Fields returned by the resolved-ticket poll (the key is always included)
+RESOLVED_POLL_FIELDS = "summary,resolutiondate"
+
+# Resolved-ticket poll query; only the window changes between polls
+RESOLVED_JQL = (
+    "project = {project_key} AND resolutiondate >= -{lookback_minutes}m "
+    "ORDER BY resolutiondate ASC"
+)
+
+# Maximum number of keys per "key in (...)" search request
+BULK_FETCH_CHUNK_SIZE = 100
+
+logger = logging.getLogger(__name__)
+
+
+class ResolvedIssue(NamedTuple):
+    """A resolved issue found by the poll; also its processed-ticket key."""
+
+    key: str
+    resolutiondate: Optional[str]
 
 
 class Client:
@@ -10,40 +40,137 @@ class Client:
         self.token = token
         self.testing_mode = testing_mode
         self.jira: JIRA = JIRA(server=self.server, basic_auth=(self.email, self.token))
+        # JIRA builds its own ResilientSession (which already retries 429/5xx);
+        # widen its connection pool so concurrent fetches reuse connections
+        mount_pooled_adapter(self.jira._session)
 
-    def test_connection(self):
+    def test_connection(self) -> bool:
+        """Check the credentials by fetching the current user."""
         try:
             # Example: Get current user info
             user_id = self.jira.current_user()
-            pprint(f"Logged in as: {user_id}")
-            user_info = self.jira.user(user_id)
-            pprint(f"User info: {user_info}")
+            logger.debug("Logged in as: %s", user_id)
+            # The user lookup is an extra round-trip, only worth it when logged
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("User info: %s", self.jira.user(user_id))
+            return True
 
         except Exception as e:
-            print(f"Failed to connect to JIRA: {e}")
+            logger.error("Failed to connect to JIRA: %s", e)
+            return False
+
+    def fetch_recently_resolved(
+        self,
+        project_key: str,
+        lookback_minutes: int = 5,
+        max_results: int = 500,
+        fields: str = RESOLVED_POLL_FIELDS,
+        start_at: int = 0,
+    ) -> List[ResolvedIssue]:
+        """
+        Find issues in a project resolved within the lookback window.
+
+        The poll only needs keys and resolution dates, so a narrow field list
+        keeps the response small; get_full_ticket fetches the rest.
 
-    def fetch_recently_resolved(self, project_key: str, lookback_minutes: int = 5):
-        jql = f"project = {project_key} AND resolutiondate >= -{lookback_minutes}m"
+        Args:
+            project_key: JIRA project key
+            lookback_minutes: How far back to look for resolutions
+            max_results: Maximum number of issues to return; the jira library
+                pages through results up to this count
+            fields: Comma-separated fields to fetch for each issue
+            start_at: Index of the first result to return, for paging through
+                windows with more than max_results resolutions
+
+        Returns:
+            Key and resolution date of each matching issue, oldest resolution
+            first
+        """
+        jql = RESOLVED_JQL.format(
+            project_key=project_key, lookback_minutes=lookback_minutes
+        )
         issues = self.jira.search_issues(
             jql_str=jql,
-            maxResults=100,
-            fields="key,summary,status,resolution,resolutiondate",
+            startAt=start_at,
+            maxResults=max_results,
+            fields=fields,
         )
-        return issues
+        return [
+            ResolvedIssue(issue.key, issue.raw["fields"].get("resolutiondate"))
+            for issue in issues
+        ]
 
     def get_ticket(self, ticket_id: str):
         """Simple method to get basic JIRA issue object."""
         return self.jira.issue(ticket_id)
 
-    def get_full_ticket(self, ticket_id: str) -> Dict[str, Any]:
+    def get_full_ticket(
+        self,
+        ticket_id: str,
+        fields: Optional[str] = None,
+        expand: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
-        Get the full JIRA issue with all data expanded.
+        Get a JIRA issue with the fields needed for analysis.
+
+        Only the fields the agent renders are requested by default. Asking for
+        expand="all" made JIRA serialize the changelog, rendered fields,
+        transitions and edit metadata, often hundreds of KB per issue, none
+        of which is used. Pass fields="*all" or an expand value such as
+        "changelog" when that data is needed.
 
         Args:
             ticket_id: The JIRA ticket key (e.g., 'PROJ-123')
+            fields: Comma-separated fields to fetch (default: FULL_TICKET_FIELDS)
+            expand: Optional comma-separated expansions (e.g., 'changelog')
 
         Returns:
-            Dict of the full JIRA Issue (all fields, comments, attachments, history)
+            Dict of the raw JIRA issue (requested fields, comments, attachments)
+        """
+        return self.jira.issue(
+            ticket_id, fields=fields or FULL_TICKET_FIELDS, expand=expand
+        ).raw
+
+    def get_tickets_bulk(
+        self,
+        keys: List[str],
+        fields: Optional[str] = None,
+        expand: Optional[str] = None,
+        max_workers: int = 4,
+    ) -> List[Dict[str, Any]]:
         """
-        # return self.jira.issue(ticket_id, expand="changelog,renderedFields")
-        return self.jira.issue(ticket_id, expand="all").raw
+        Fetch several JIRA issues with one search request per 100 keys.
+
+        Chunks are fetched in parallel when more than 100 keys are requested.
+
+        Args:
+            keys: JIRA ticket keys (e.g., ['PROJ-1', 'PROJ-2'])
+            fields: Comma-separated fields to fetch (default: FULL_TICKET_FIELDS)
+            expand: Optional comma-separated expansions (e.g., 'changelog')
+            max_workers: Maximum number of concurrent chunk requests
+
+        Returns:
+            List of raw JIRA issue dicts (order is not guaranteed)
+        """
+        if not keys:
+            return []
+
+        chunks = [
+            keys[i : i + BULK_FETCH_CHUNK_SIZE]
+            for i in range(0, len(keys), BULK_FETCH_CHUNK_SIZE)
+        ]
+
+        def _fetch(chunk: List[str]) -> List[Dict[str, Any]]:
+            issues = self.jira.search_issues(
+                jql_str=f"key in ({','.join(chunk)})",
+                maxResults=len(chunk),
+                fields=fields or FULL_TICKET_FIELDS,
+                expand=expand,
+            )
+            return [issue.raw for issue in issues]
+
+        if len(chunks) == 1:
+            return _fetch(chunks[0])
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as ex:
+            return [raw for result in ex.map(_fetch, chunks) for raw in result]
@@ -1,11 +1,27 @@
 """Configuration management for the JIRA agent."""
 
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import Mapping, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+def _env_bool(env: Mapping[str, str], key: str, default: bool = False) -> bool:
+    """Read a boolean flag; accepts 1/true/yes/on in any case."""
+    value = env.get(key)
+    return default if value is None else value.strip().lower() in _TRUTHY
+
+
+def _env_int(env: Mapping[str, str], key: str, default: int) -> int:
+    """Read an integer setting, falling back to default when unset or empty."""
+    value = env.get(key)
+    return int(value) if value else default
+
+
+@dataclass(frozen=True, slots=True)
 class ServiceConfig:
     """Configuration for all external services."""
 
@@ -15,6 +31,7 @@ class ServiceConfig:
     jira_token: Optional[str] = None
     jira_testing_mode: bool = False
     jira_project_key: Optional[str] = None
+    jira_page_size: int = 500
 
     # Confluence settings
     confluence_server: Optional[str] = None
@@ -22,49 +39,120 @@ class ServiceConfig:
     confluence_token: Optional[str] = None
     confluence_space: Optional[str] = None
     confluence_auto_submit: bool = False
+    confluence_cache_ttl: int = 60
+    confluence_page_cache_ttl: int = 300
+    confluence_cache_path: Optional[str] = None
+    confluence_query_ticket_budget: int = 4000
+    confluence_max_articles: int = 10
+    confluence_max_chars_per_article: int = 0
+    min_ticket_chars_for_search: int = 80
 
     # LLM settings
     llm_provider: str = "openai"
     openai_api_key: Optional[str] = None
     openai_base_url: Optional[str] = None
     openai_model: Optional[str] = None
+    llm_cache_enabled: bool = False
+    llm_cache_path: Optional[str] = None
+    llm_cache_ttl: int = 0
 
     # AWS Bedrock settings
     aws_region: Optional[str] = None
     aws_access_key_id: Optional[str] = None
     aws_secret_access_key: Optional[str] = None
     bedrock_inference_profile: Optional[str] = None
+    bedrock_latency_optimized: bool = False
+    bedrock_prompt_caching: bool = False
 
     # Runtime settings
     use_static_tickets: bool = False
+    ingestion_mode: str = "poll"
+    webhook_host: str = "127.0.0.1"
+    webhook_port: int = 8080
+    webhook_secret: Optional[str] = None
     poll_interval_seconds: int = 30
+    poll_max_interval_seconds: int = 240
+    max_concurrent_tickets: int = 4
     lookback_minutes: int = 300
 
     @classmethod
-    def from_env(cls) -> "ServiceConfig":
-        """Load configuration from environment variables."""
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> "ServiceConfig":
+        """
+        Load configuration from environment variables.
+
+        Args:
+            env: Variables to read (default: a snapshot of os.environ), so
+                every setting comes from one consistent view
+
+        Returns:
+            The loaded configuration
+        """
+        if env is None:
+            env = dict(os.environ)
         return cls(
-            jira_server=os.getenv("JIRA_SERVER"),
-            jira_email=os.getenv("JIRA_EMAIL"),
-            jira_token=os.getenv("JIRA_API_TOKEN"),
-            jira_testing_mode=os.getenv("TESTING_MODE", "").lower() == "true",
-            jira_project_key=os.getenv("JIRA_PROJECT_KEY"),
-            confluence_server=os.getenv("CONFLUENCE_SERVER"),
-            confluence_email=os.getenv("CONFLUENCE_EMAIL"),
-            confluence_token=os.getenv("CONFLUENCE_API_TOKEN"),
-            confluence_space=os.getenv("CONFLUENCE_SPACE_KEY"),
-            confluence_auto_submit=os.getenv("CONFLUENCE_AUTO_SUBMIT", "false").lower()
-            == "true",
-            llm_provider=os.getenv("LLM_PROVIDER", "openai").lower(),
-            openai_api_key=os.getenv("OPENAI_API_KEY"),
-            openai_base_url=os.getenv("OPENAI_BASE_URL"),
-            openai_model=os.getenv("OPENAI_MODEL"),
-            aws_region=os.getenv("AWS_REGION"),
-            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-            bedrock_inference_profile=os.getenv("BEDROCK_INFERENCE_PROFILE"),
-            use_static_tickets=os.getenv("USE_STATIC_TICKETS", "false").lower()
-            == "true",
-            poll_interval_seconds=int(os.getenv("POLL_INTERVAL_SECONDS", "30")),
-            lookback_minutes=int(os.getenv("LOOKBACK_MINUTES", "300")),
+            jira_server=env.get("JIRA_SERVER"),
+            jira_email=env.get("JIRA_EMAIL"),
+            jira_token=env.get("JIRA_API_TOKEN"),
+            jira_testing_mode=_env_bool(env, "TESTING_MODE"),
+            jira_project_key=env.get("JIRA_PROJECT_KEY"),
+            jira_page_size=_env_int(env, "JIRA_PAGE_SIZE", 500),
+            confluence_server=env.get("CONFLUENCE_SERVER"),
+            confluence_email=env.get("CONFLUENCE_EMAIL"),
+            confluence_token=env.get("CONFLUENCE_API_TOKEN"),
+            confluence_space=env.get("CONFLUENCE_SPACE_KEY"),
+            confluence_auto_submit=_env_bool(env, "CONFLUENCE_AUTO_SUBMIT"),
+            confluence_cache_ttl=_env_int(env, "CONFLUENCE_CACHE_TTL", 60),
+            confluence_page_cache_ttl=_env_int(env, "CONFLUENCE_PAGE_CACHE_TTL", 300),
+            confluence_cache_path=env.get("CONFLUENCE_CACHE_PATH"),
+            confluence_query_ticket_budget=_env_int(
+                env, "CONFLUENCE_QUERY_TICKET_BUDGET", 4000
+            ),
+            confluence_max_articles=_env_int(env, "CONFLUENCE_MAX_ARTICLES", 10),
+            confluence_max_chars_per_article=_env_int(
+                env, "CONFLUENCE_MAX_CHARS_PER_ARTICLE", 0
+            ),
+            min_ticket_chars_for_search=_env_int(
+                env, "MIN_TICKET_CHARS_FOR_SEARCH", 80
+            ),
+            llm_provider=env.get("LLM_PROVIDER", "openai").lower(),
+            openai_api_key=env.get("OPENAI_API_KEY"),
+            openai_base_url=env.get("OPENAI_BASE_URL"),
+            openai_model=env.get("OPENAI_MODEL"),
+            llm_cache_enabled=_env_bool(env, "LLM_CACHE_ENABLED"),
+            llm_cache_path=env.get("LLM_CACHE_PATH"),
+            llm_cache_ttl=_env_int(env, "LLM_CACHE_TTL_SECONDS", 0),
+            aws_region=env.get("AWS_REGION"),
+            aws_access_key_id=env.get("AWS_ACCESS_KEY_ID"),
+            aws_secret_access_key=env.get("AWS_SECRET_ACCESS_KEY"),
+            bedrock_inference_profile=env.get("BEDROCK_INFERENCE_PROFILE"),
+            bedrock_latency_optimized=_env_bool(env, "BEDROCK_LATENCY_OPTIMIZED"),
+            bedrock_prompt_caching=_env_bool(env, "BEDROCK_PROMPT_CACHING"),
+            use_static_tickets=_env_bool(env, "USE_STATIC_TICKETS"),
+            ingestion_mode=env.get("INGESTION_MODE", "poll").lower(),
+            webhook_host=env.get("WEBHOOK_HOST", "127.0.0.1"),
+            webhook_port=_env_int(env, "WEBHOOK_PORT", 8080),
+            webhook_secret=env.get("WEBHOOK_SECRET"),
+            poll_interval_seconds=_env_int(env, "POLL_INTERVAL_SECONDS", 30),
+            poll_max_interval_seconds=_env_int(env, "POLL_MAX_INTERVAL_SECONDS", 240),
+            max_concurrent_tickets=_env_int(env, "MAX_CONCURRENT_TICKETS", 4),
+            lookback_minutes=_env_int(env, "LOOKBACK_MINUTES", 300),
         )
+
+
+@lru_cache(maxsize=1)
+def _load_dotenv_once() -> None:
+    """Load the .env file into the environment, at most once per process."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+@lru_cache(maxsize=1)
+def get_config() -> ServiceConfig:
+    """
+    Return the process-wide configuration, reading .env and the environment once.
+
+    Call get_config.cache_clear() to pick up environment changes.
+    """
+    _load_dotenv_once()
+    return ServiceConfig.from_env()
@@ -1,24 +1,147 @@
 """Confluence integration handler for JIRA agent."""
 
-import json
 import time
+import hashlib
 import logging
-from typing import Optional, List, Dict, Any, Set
-from ..atlassian import confluence
-from ..agent import llm
-from ..prompts import PromptTemplate, load_prompt_values
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Sequence, Set, Tuple
+from ..prompts import PromptTemplate
+from ..utils import fastjson
+from ..utils.cache import MemoryBackend
+
+if TYPE_CHECKING:
+    from ..atlassian import confluence
+    from ..agent import llm
 
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent Confluence writes per analysis, to stay well
+# inside Confluence Cloud rate limits
+MAX_CONCURRENT_WRITES = 4
+
+# Locks that serialize writes to the same article title across tickets;
+# unrelated titles rarely share one
+WRITE_LOCK_STRIPES = 64
+
+# Issue fields that change without changing what the ticket is about
+_VOLATILE_FIELDS = frozenset({"updated", "lastViewed", "watches", "votes"})
+
+
+def _trim_ticket_data(
+    ticket_data: Dict[str, Any], per_field_chars: int
+) -> Dict[str, Any]:
+    """
+    Copy ticket data with the description and comment bodies cut to a budget.
+
+    Only the containers that change are copied; the caller's dict is untouched.
+
+    Args:
+        ticket_data: Raw JIRA issue dict (or a bare fields dict)
+        per_field_chars: Maximum characters per field (0 disables trimming)
+
+    Returns:
+        Ticket data safe to render into the search-query prompt
+    """
+    if per_field_chars <= 0:
+        return ticket_data
+
+    def trim(text: Any) -> Any:
+        if isinstance(text, str) and len(text) > per_field_chars:
+            return text[:per_field_chars] + "…[truncated]"
+        return text
+
+    has_fields = "fields" in ticket_data
+    fields = dict((ticket_data.get("fields") or {}) if has_fields else ticket_data)
+    fields["description"] = trim(fields.get("description"))
+
+    comment = fields.get("comment")
+    if isinstance(comment, dict) and comment.get("comments"):
+        fields["comment"] = {
+            **comment,
+            "comments": [
+                {**c, "body": trim(c.get("body"))} if isinstance(c, dict) else c
+                for c in comment["comments"]
+            ],
+        }
+
+    return {**ticket_data, "fields": fields} if has_fields else fields
+
+
+def _ticket_text_length(fields: Dict[str, Any]) -> int:
+    """Characters of summary, description and comment text in a ticket."""
+    texts = [fields.get("summary"), fields.get("description")]
+    comment = fields.get("comment")
+    if isinstance(comment, dict):
+        texts.extend(
+            c.get("body") for c in comment.get("comments") or () if isinstance(c, dict)
+        )
+    return sum(len(text.strip()) for text in texts if isinstance(text, str))
+
+
+@dataclass(frozen=True, slots=True)
+class ExistingArticleUpdate:
+    """One entry of the analysis response's existingArticleUpdates list."""
+
+    article_title: Optional[str] = None
+    suggested_changes: Optional[str] = None
+    redrafted_content: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ExistingArticleUpdate":
+        return cls(
+            article_title=data.get("articleTitle"),
+            suggested_changes=data.get("suggestedChanges"),
+            redrafted_content=data.get("redraftedContent"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class TicketAnalysis:
+    """Ticket analysis response returned by the LLM."""
+
+    needs_new_article: bool = False
+    proposed_title: Optional[str] = None
+    sections: Tuple[str, ...] = ()
+    existing_article_updates: Tuple[ExistingArticleUpdate, ...] = ()
+    reasoning: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "TicketAnalysis":
+        """
+        Build an analysis from the decoded response JSON.
+
+        Raises:
+            ValueError: If the response is not a JSON object
+        """
+        if not isinstance(data, dict):
+            raise ValueError(f"Expected a JSON object, got {type(data).__name__}")
+        return cls(
+            needs_new_article=bool(data.get("needsNewArticle")),
+            proposed_title=data.get("proposedTitle"),
+            sections=tuple(data.get("sections") or ()),
+            existing_article_updates=tuple(
+                ExistingArticleUpdate.from_dict(update)
+                for update in data.get("existingArticleUpdates") or ()
+                if isinstance(update, dict)
+            ),
+            reasoning=data.get("reasoning"),
+        )
+
 
 class ConfluenceHandler:
     """Handles Confluence integration for ticket analysis and documentation."""
 
     def __init__(
         self,
-        confluence_service: confluence.Client,
-        llm_service: llm.LLM,
+        confluence_service: "confluence.Client",
+        llm_service: "llm.LLM",
+        query_ticket_budget: int = 4000,
+        max_articles: int = 10,
+        max_chars_per_article: int = 0,
+        min_ticket_chars: int = 80,
     ):
         """
         Initialize the Confluence handler.
@@ -26,9 +149,87 @@ class ConfluenceHandler:
         Args:
             confluence_service: Confluence API client
             llm_service: LLM service for generating queries and analysis
+            query_ticket_budget: Maximum characters of the description and of
+                each comment sent for search-query generation (0 = no limit)
+            max_articles: Maximum number of articles returned per ticket, in
+                search rank order (0 = no limit)
+            max_chars_per_article: Maximum characters of each article body
+                passed on for analysis (0 = no limit)
+            min_ticket_chars: Tickets whose summary, description and comments
+                together are shorter than this skip search-query generation
         """
         self.confluence_service = confluence_service
         self.llm_service = llm_service
+        self.query_ticket_budget = query_ticket_budget
+        self.max_articles = max_articles
+        self.max_chars_per_article = max_chars_per_article
+        self.min_ticket_chars = min_ticket_chars
+        # Generated search queries, keyed by a hash of the prompt and ticket
+        self._query_cache = MemoryBackend(maxsize=1024)
+        # Tickets are processed concurrently, and an append reads the page
+        # body before writing it back, so writes to one title must not overlap
+        self._write_locks = tuple(threading.Lock() for _ in range(WRITE_LOCK_STRIPES))
+        self.reload_prompts()
+
+    def _write_lock(self, title: Optional[str]) -> threading.Lock:
+        """Lock held while creating or updating the article with this title."""
+        stripe = hash((title or "").strip().casefold()) % len(self._write_locks)
+        return self._write_locks[stripe]
+
+    def reload_prompts(self) -> None:
+        """
+        Load the search prompt file and build its template.
+
+        The prompt is static, so this runs once at construction; keeping the
+        message prefix byte-identical across calls also lets providers reuse
+        their prompt cache for everything before the ticket context. Call it
+        again after editing the prompt file.
+        """
+        template = PromptTemplate.from_file(
+            env_var="PROMPT_CONFLUENCE_SEARCH",
+            default_filename="confluence_search.prompt",
+        )
+        examples = template.examples or ()
+        self._search_template = template
+        self._search_examples = examples
+        self._prompt_fingerprint = fastjson.dumps(
+            [
+                template.system_prompt,
+                template.instruction_template,
+                [dict(e) for e in examples],
+            ]
+        )
+        # Queries generated with the old prompt no longer apply
+        self._query_cache.clear()
+
+    def clear_cache(self) -> None:
+        """Drop memoized search queries and the client's cached Confluence results."""
+        self._query_cache.clear()
+        self.confluence_service.invalidate()
+
+    def _ticket_fingerprint(self, ticket_data: Dict[str, Any]) -> Optional[str]:
+        """
+        Hash the ticket content together with the search prompt and budget.
+
+        Volatile fields such as 'updated' are ignored, so an unchanged ticket
+        maps to the same key on every poll.
+        """
+        fields = ticket_data.get("fields")
+        if isinstance(fields, dict):
+            ticket_data = {
+                **ticket_data,
+                "fields": {
+                    k: v for k, v in fields.items() if k not in _VOLATILE_FIELDS
+                },
+            }
+        try:
+            payload = fastjson.dumps(ticket_data, sort_keys=True)
+        except TypeError:
+            return None
+        digest = hashlib.blake2b(self._prompt_fingerprint, digest_size=16)
+        digest.update(b"%d\0" % self.query_ticket_budget)
+        digest.update(payload)
+        return digest.hexdigest()
 
     def search_for_ticket(self, ticket_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -48,68 +249,155 @@ class ConfluenceHandler:
             if not search_queries:
                 return []
 
-            logger.info(f"Generated {len(search_queries)} search queries")
-            for i, query in enumerate(search_queries, 1):
-                logger.info(f"  Query {i}: {query}")
+            logger.info("Generated %d search queries", len(search_queries))
+            if logger.isEnabledFor(logging.INFO):
+                for i, query in enumerate(search_queries, 1):
+                    logger.info("  Query %d: %s", i, query)
 
             # Execute searches and deduplicate results
             return self._execute_searches(search_queries)
 
         except Exception as e:
-            logger.error(f"Error searching Confluence: {e}", exc_info=True)
+            logger.error("Error searching Confluence: %s", e, exc_info=True)
             return []
 
     def _generate_search_queries(self, ticket_data: Dict[str, Any]) -> List[str]:
-        """Generate search queries using LLM."""
-        system_prompt, instruction_text, examples = load_prompt_values(
-            env_var="PROMPT_CONFLUENCE_SEARCH",
-            default_filename="confluence_search.prompt",
-        )
-        search_template = PromptTemplate(
-            system_prompt=system_prompt,
-            instruction_template=instruction_text,
+        """Generate search queries using LLM, reusing them for unchanged tickets."""
+        fingerprint = self._ticket_fingerprint(ticket_data)
+        if fingerprint is not None:
+            cached = self._query_cache.get(fingerprint)
+            if cached is not None:
+                logger.debug("Reusing search queries for unchanged ticket")
+                return list(cached)
+
+        search_queries = self._request_search_queries(ticket_data)
+        if search_queries and fingerprint is not None:
+            self._query_cache.set(fingerprint, tuple(search_queries))
+        return search_queries
+
+    def _request_search_queries(self, ticket_data: Dict[str, Any]) -> List[str]:
+        """Ask the LLM for search queries for a ticket."""
+        fields = (
+            (ticket_data.get("fields") or {})
+            if "fields" in ticket_data
+            else ticket_data
         )
+        # Too little text yields generic queries that find nothing useful,
+        # so save the LLM round trip. Comments count, since resolved tickets
+        # often keep their detail there
+        text_len = _ticket_text_length(fields)
+        if not text_len or text_len < self.min_ticket_chars:
+            logger.info(
+                "Skipping Confluence search for %s: %d chars of ticket text, "
+                "below MIN_TICKET_CHARS_FOR_SEARCH=%d",
+                ticket_data.get("key", "ticket"),
+                text_len,
+                self.min_ticket_chars,
+            )
+            return []
 
-        formatted_messages = search_template.format_messages(
-            ticket_data=ticket_data,
-            examples=examples,
+        formatted_messages = self._search_template.format_messages(
+            ticket_data=_trim_ticket_data(ticket_data, self.query_ticket_budget),
+            examples=self._search_examples,
+            content_blocks=self.llm_service.prompt_caching,
         )
 
-        response = self.llm_service.generate_response(prompt=formatted_messages)
+        response = self.llm_service.generate_response(
+            prompt=formatted_messages, **self.llm_service.deterministic_kwargs
+        )
 
         try:
-            search_queries = json.loads(response)
+            search_queries = fastjson.loads(response)
             if not isinstance(search_queries, list):
-                logger.warning(f"Expected list of queries, got {type(search_queries)}")
+                logger.warning("Expected list of queries, got %s", type(search_queries))
                 return []
             return search_queries
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse search queries JSON: {e}")
-            logger.debug(f"Raw LLM response: {response}")
+        except fastjson.JSONDecodeError as e:
+            logger.error("Failed to parse search queries JSON: %s", e)
+            logger.debug("Raw LLM response: %s", response)
             return []
 
-    def _execute_searches(self, search_queries: List[str]) -> List[Dict[str, Any]]:
-        """Execute Confluence searches and deduplicate results."""
-        all_results = []
-        seen_ids: Set[str] = set()
+    @staticmethod
+    def _unique_queries(search_queries: List[str]) -> List[str]:
+        """
+        Normalize queries and drop the duplicates that leaves.
 
+        CQL text search ignores case, spacing and trailing punctuation, so
+        duplicates would only repeat a request whose hits the id dedup
+        discards. Searching with the normalized form also lets tickets that
+        phrase a query differently share the Confluence client's cached
+        results.
+        """
+        unique = []
+        seen: Set[str] = set()
         for query in search_queries:
-            logger.debug(f"Searching Confluence: {query}")
-            results = self.confluence_service.search_articles(query, limit=5)
-
-            for article in results:
-                article_id = article.get("id")
-                if article_id and article_id not in seen_ids:
-                    seen_ids.add(article_id)
-                    # Fetch full content for each article
-                    page_content = self.confluence_service.get_page_content(article_id)
-                    if page_content:
-                        article["content"] = page_content.get("content", "")
-                    all_results.append(article)
-
-        logger.info(f"Found {len(all_results)} unique Confluence articles")
-        return all_results
+            if not isinstance(query, str):
+                continue
+            normalized = " ".join(query.lower().split()).rstrip(".,;:!?")
+            if normalized and normalized not in seen:
+                seen.add(normalized)
+                unique.append(normalized)
+        return unique
+
+    def _execute_searches(
+        self, search_queries: List[str], max_workers: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute Confluence searches and deduplicate results.
+
+        All searches run concurrently and return page bodies inline; only hits
+        whose body was not expanded are fetched afterwards, also concurrently.
+        Results keep query order and are capped at max_articles, so hits past
+        the cap are never fetched.
+        """
+        search_queries = self._unique_queries(search_queries)
+        if not search_queries:
+            return []
+
+        # Keyed by page id; dicts keep insertion order, so this both
+        # deduplicates and preserves query order
+        results_by_id: Dict[str, Dict[str, Any]] = {}
+
+        def search(query: str) -> List[Dict[str, Any]]:
+            logger.debug("Searching Confluence: %s", query)
+            return self.confluence_service.search_articles(
+                query, limit=5, expand_body=True
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(search_queries))
+        ) as ex:
+            for results in ex.map(search, search_queries):
+                for article in results:
+                    if self.max_articles and len(results_by_id) >= self.max_articles:
+                        break
+                    article_id = article.get("id")
+                    if article_id and article_id not in results_by_id:
+                        results_by_id[article_id] = article
+
+        # Fetch full content for any article the search returned without a body
+        missing = [
+            article for article in results_by_id.values() if "content" not in article
+        ]
+        pages = self.confluence_service.get_pages_bulk(
+            [article["id"] for article in missing], max_workers=max_workers
+        )
+        for article, page_content in zip(missing, pages):
+            if page_content:
+                article["content"] = page_content.get("content", "")
+
+        if self.max_chars_per_article:
+            for article in results_by_id.values():
+                content = article.get("content")
+                if content and len(content) > self.max_chars_per_article:
+                    article["content"] = (
+                        content[: self.max_chars_per_article] + "\n[content truncated]"
+                    )
+                    article["truncated"] = True
+
+        logger.info("Found %d unique Confluence articles", len(results_by_id))
+        return list(results_by_id.values())
 
     def submit_analysis(self, llm_response: str, ticket_key: str = "Unknown") -> None:
         """
@@ -121,47 +409,82 @@ class ConfluenceHandler:
         """
         try:
             # Parse the LLM response
-            analysis = json.loads(llm_response)
+            analysis = TicketAnalysis.from_dict(fastjson.loads(llm_response))
+
+            logger.info("Processing Confluence submissions for %s", ticket_key)
+            logger.debug("Analysis: %s", analysis.reasoning or "No reasoning provided")
 
-            logger.info(f"Processing Confluence submissions for {ticket_key}")
-            logger.debug(
-                f"Analysis: {analysis.get('reasoning', 'No reasoning provided')}"
+            create_article = bool(
+                analysis.needs_new_article and analysis.proposed_title
             )
 
-            # Handle new article creation
-            if analysis.get("needsNewArticle") and analysis.get("proposedTitle"):
-                self._create_new_article(
-                    title=analysis.get("proposedTitle"),
-                    sections=analysis.get("sections", []),
-                    ticket_key=ticket_key,
-                )
-
-            # Handle existing article updates
-            existing_updates = analysis.get("existingArticleUpdates", [])
-            if existing_updates:
-                for update in existing_updates:
-                    self._update_existing_article(
-                        article_title=update.get("articleTitle"),
-                        suggested_changes=update.get("suggestedChanges"),
-                        redrafted_content=update.get("redraftedContent"),
-                        ticket_key=ticket_key,
-                    )
+            # Updates to the same article stay in order within one task so
+            # they don't race on the page version
+            updates_by_title: Dict[Any, List[ExistingArticleUpdate]] = {}
+            for update in analysis.existing_article_updates:
+                updates_by_title.setdefault(update.article_title, []).append(update)
+
+            # The create and each article's updates are independent writes,
+            # so they run concurrently
+            task_count = create_article + len(updates_by_title)
+            if task_count:
+                with ThreadPoolExecutor(
+                    max_workers=min(MAX_CONCURRENT_WRITES, task_count)
+                ) as ex:
+                    futures = []
+
+                    # Handle new article creation
+                    if create_article:
+                        futures.append(
+                            ex.submit(
+                                self._create_new_article,
+                                title=analysis.proposed_title,
+                                sections=analysis.sections,
+                                ticket_key=ticket_key,
+                            )
+                        )
+
+                    # Handle existing article updates
+                    for updates in updates_by_title.values():
+                        futures.append(
+                            ex.submit(self._apply_article_updates, updates, ticket_key)
+                        )
+
+                    for future in as_completed(futures):
+                        future.result()
 
             # Log if no action was needed
-            if not analysis.get("needsNewArticle") and not existing_updates:
+            if not analysis.needs_new_article and not analysis.existing_article_updates:
                 logger.info(
-                    f"No Confluence changes needed for {ticket_key}: "
-                    f"{analysis.get('reasoning', 'Already covered')}"
+                    "No Confluence changes needed for %s: %s",
+                    ticket_key,
+                    analysis.reasoning or "Already covered",
                 )
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse LLM response as JSON: {e}")
-            logger.debug(f"Raw response: {llm_response}")
+        except fastjson.JSONDecodeError as e:
+            logger.error("Failed to parse LLM response as JSON: %s", e)
+            logger.debug("Raw response: %s", llm_response)
+        except ValueError as e:
+            logger.error("Unexpected LLM response format: %s", e)
+            logger.debug("Raw response: %s", llm_response)
         except Exception as e:
-            logger.error(f"Error submitting to Confluence: {e}", exc_info=True)
+            logger.error("Error submitting to Confluence: %s", e, exc_info=True)
+
+    def _apply_article_updates(
+        self, updates: List[ExistingArticleUpdate], ticket_key: str
+    ) -> None:
+        """Apply one article's suggested updates in order."""
+        with self._write_lock(updates[0].article_title):
+            for update in updates:
+                self._update_existing_article(
+                    article_title=update.article_title,
+                    suggested_changes=update.suggested_changes,
+                    redrafted_content=update.redrafted_content,
+                    ticket_key=ticket_key,
+                )
 
     def _create_new_article(
-        self, title: str, sections: List[str], ticket_key: str
+        self, title: str, sections: Sequence[str], ticket_key: str
     ) -> None:
         """
         Create a new Confluence article with the proposed title and sections.
@@ -172,7 +495,7 @@ class ConfluenceHandler:
             ticket_key: The ticket key for logging and reference
         """
         try:
-            logger.info(f"Creating new Confluence article: '{title}'")
+            logger.info("Creating new Confluence article: '%s'", title)
 
             # Generate basic HTML structure with sections
             content_parts = [
@@ -188,20 +511,21 @@ class ConfluenceHandler:
             content = "\n".join(content_parts)
 
             # Create the page
-            result = self.confluence_service.create_page(
-                title=f"[DRAFT] {title}",
-                content=content,
-            )
+            with self._write_lock(title):
+                result = self.confluence_service.create_page(
+                    title=f"[DRAFT] {title}",
+                    content=content,
+                )
 
             if result:
                 logger.info(
-                    f"Successfully created Confluence page: {result.get('url')}"
+                    "Successfully created Confluence page: %s", result.get("url")
                 )
             else:
-                logger.warning(f"Failed to create Confluence page for {ticket_key}")
+                logger.warning("Failed to create Confluence page for %s", ticket_key)
 
         except Exception as e:
-            logger.error(f"Error creating Confluence article: {e}", exc_info=True)
+            logger.error("Error creating Confluence article: %s", e, exc_info=True)
 
     def _update_existing_article(
         self,
@@ -220,23 +544,31 @@ class ConfluenceHandler:
             ticket_key: The ticket key for logging and reference
         """
         try:
-            logger.info(f"Updating Confluence article: '{article_title}'")
+            logger.info("Updating Confluence article: '%s'", article_title)
 
-            # Find the page by title
-            page = self.confluence_service.find_page_by_title(article_title)
+            # Find the page by title. The append path also needs its body and
+            # version, read fresh since they are written straight back
+            append = not redrafted_content
+            page = self.confluence_service.find_page_by_title(
+                article_title, expand_body=append, use_cache=not append
+            )
 
             if not page:
                 logger.warning(
-                    f"Could not find Confluence page '{article_title}'. "
-                    "Creating as new page instead."
+                    "Could not find Confluence page '%s'. Creating as new page instead.",
+                    article_title,
                 )
                 # Create a new page with the suggested changes
-                content = f"<p><em>Original article '{article_title}' not found. "
-                content += f"Created from ticket {ticket_key}</em></p>"
-                content += f"<h2>Suggested Changes</h2><p>{suggested_changes}</p>"
+                content_parts = [
+                    f"<p><em>Original article '{article_title}' not found. ",
+                    f"Created from ticket {ticket_key}</em></p>",
+                    f"<h2>Suggested Changes</h2><p>{suggested_changes}</p>",
+                ]
 
                 if redrafted_content:
-                    content += f"<h2>Content</h2>{redrafted_content}"
+                    content_parts.append(f"<h2>Content</h2>{redrafted_content}")
+
+                content = "".join(content_parts)
 
                 self.confluence_service.create_page(
                     title=f"[DRAFT] {article_title}",
@@ -244,9 +576,9 @@ class ConfluenceHandler:
                 )
                 return
 
-            # If we have redrafted content, use it; otherwise add a comment section
+            # If we have redrafted content, use it as is; the current body is
+            # never fetched on this path
             if redrafted_content:
-                # Update with the complete redrafted content
                 version_comment = (
                     f"Updated based on ticket {ticket_key}: {suggested_changes}"
                 )
@@ -256,36 +588,55 @@ class ConfluenceHandler:
                     content=redrafted_content,
                     version_comment=version_comment,
                 )
-            else:
-                # Get current content and append suggestions
-                current_page = self.confluence_service.get_page_content(page["id"])
+                self._log_update_result(result, article_title)
+                return
+
+            # Otherwise append suggestions to the body returned with the search
+            # hit, fetching it separately only if the search didn't include it
+            current_content = page.get("content")
+            current_version = page.get("version")
+            if current_content is None:
+                current_page = self.confluence_service.get_page_content(
+                    page["id"], use_cache=False
+                )
                 if not current_page:
-                    logger.warning(f"Could not retrieve content for page {page['id']}")
+                    logger.warning("Could not retrieve content for page %s", page["id"])
                     return
-
                 current_content = current_page.get("content", "")
+                current_version = current_page.get("version")
+
+            # Append suggested changes as a new section
+            updated_content = "".join(
+                [
+                    current_content,
+                    "\n<hr />\n",
+                    f"<h2>Suggested Updates (from {ticket_key})</h2>",
+                    f"<p>{suggested_changes}</p>",
+                    f"<p><em>Added automatically on {time.strftime('%Y-%m-%d')}</em></p>",
+                ]
+            )
 
-                # Append suggested changes as a new section
-                updated_content = current_content
-                updated_content += "\n<hr />\n"
-                updated_content += f"<h2>Suggested Updates (from {ticket_key})</h2>"
-                updated_content += f"<p>{suggested_changes}</p>"
-                updated_content += f"<p><em>Added automatically on {time.strftime('%Y-%m-%d')}</em></p>"
-
-                version_comment = f"Added suggestions from ticket {ticket_key}"
-                result = self.confluence_service.update_page(
-                    page_id=page["id"],
-                    title=page["title"],
-                    content=updated_content,
-                    version_comment=version_comment,
-                )
-
-            if result:
-                logger.info(
-                    f"Successfully updated Confluence page: {result.get('url')}"
-                )
-            else:
-                logger.warning(f"Failed to update Confluence page '{article_title}'")
+            # Passing the version read above makes Confluence reject the write
+            # if someone edited the page in the meantime
+            version_comment = f"Added suggestions from ticket {ticket_key}"
+            result = self.confluence_service.update_page(
+                page_id=page["id"],
+                title=page["title"],
+                content=updated_content,
+                version_comment=version_comment,
+                version=current_version,
+            )
+            self._log_update_result(result, article_title)
 
         except Exception as e:
-            logger.error(f"Error updating Confluence article: {e}", exc_info=True)
+            logger.error("Error updating Confluence article: %s", e, exc_info=True)
+
+    @staticmethod
+    def _log_update_result(
+        result: Optional[Dict[str, Any]], article_title: str
+    ) -> None:
+        """Log the outcome of an update_page call."""
+        if result:
+            logger.info("Successfully updated Confluence page: %s", result.get("url"))
+        else:
+            logger.warning("Failed to update Confluence page '%s'", article_title)
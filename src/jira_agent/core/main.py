@@ -3,37 +3,73 @@ Alternative main application logic for the JIRA agent.
 Demonstrates improved structure, logging, and error handling.
 """
 
+import math
 import time
+import hashlib
+import signal
 import logging
-from typing import Optional, List, Dict, Any, Set, Tuple
-from dotenv import load_dotenv
-from pprint import pprint
-from ..atlassian import jira, confluence
-from ..agent import llm
-from ..prompts import PromptTemplate, load_prompt_values
-from .config import ServiceConfig
-from .confluence_handler import ConfluenceHandler
-
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Mapping, Tuple
+from .config import ServiceConfig, get_config
+
+# Service modules are imported where they are first used, so a run only
+# pays for the SDKs it actually touches
+if TYPE_CHECKING:
+    from ..atlassian import jira, confluence
+    from ..agent import llm
+    from ..prompts import PromptTemplate
+    from .confluence_handler import ConfluenceHandler
+
+
 logger = logging.getLogger(__name__)
 
+# Number of processed tickets remembered by the live-mode poller
+MAX_PROCESSED_TICKETS = 10_000
+
+# Seconds a successful connection test is trusted for (per server and
+# credentials), so agents re-created in one process skip the round trip
+CONNECTION_VERIFY_TTL = 300
+
+# Monotonic time of the last successful connection test, by credential key
+_VERIFIED_CONNECTIONS: Dict[Tuple[str, str, str], float] = {}
+
+
+def _credential_key(
+    service: str, server: str, email: str, token: str
+) -> Tuple[str, str, str]:
+    """Identify a server and credential pair without keeping the token itself."""
+    digest = hashlib.sha256(f"{email}\0{token}".encode()).hexdigest()
+    return service, server, digest
+
+
+def _recently_verified(key: Tuple[str, str, str]) -> bool:
+    """Whether the connection for a credential key passed a recent test."""
+    verified_at = _VERIFIED_CONNECTIONS.get(key)
+    return (
+        verified_at is not None
+        and time.monotonic() - verified_at < CONNECTION_VERIFY_TTL
+    )
+
+
+# Growth of the poll interval after each poll that found nothing new
+POLL_BACKOFF_FACTOR = 1.5
+
 
 class JiraAgent:
     """Main agent for processing JIRA tickets with LLM analysis."""
 
     def __init__(self, config: ServiceConfig):
         self.config = config
-        self.llm_service: Optional[llm.LLM] = None
-        self.jira_service: Optional[jira.Client] = None
-        self.confluence_service: Optional[confluence.Client] = None
-        self.confluence_handler: Optional[ConfluenceHandler] = None
-        self.template: Optional[PromptTemplate] = None
-        self.ticket_analyzer_examples: Optional[List[Dict[str, str]]] = None
+        self.llm_service: Optional["llm.LLM"] = None
+        self.jira_service: Optional["jira.Client"] = None
+        self.confluence_service: Optional["confluence.Client"] = None
+        self.confluence_handler: Optional["ConfluenceHandler"] = None
+        self.template: Optional["PromptTemplate"] = None
+        self.ticket_analyzer_examples: Optional[Tuple[Mapping[str, str], ...]] = None
+        # Set to stop the live-mode loop; waits between polls return early
+        self._shutdown = threading.Event()
 
     def initialize(self) -> bool:
         """
@@ -43,29 +79,45 @@ class JiraAgent:
             bool: True if core services initialized successfully, False otherwise.
         """
         try:
-            # Initialize LLM service (required)
-            self._initialize_llm()
-
-            # Initialize template (required)
-            self._initialize_template()
+            # The service initializers each wait on a network round trip and
+            # set a different attribute, so run them concurrently
+            with ThreadPoolExecutor(max_workers=3) as ex:
+                # Initialize LLM service (required)
+                llm_future = ex.submit(self._initialize_llm)
+
+                # Initialize Confluence service (optional)
+                confluence_future = ex.submit(self._initialize_confluence)
+
+                # Initialize JIRA service (only needed for live mode)
+                jira_future = (
+                    ex.submit(self._initialize_jira)
+                    if not self.config.use_static_tickets
+                    else None
+                )
 
-            # Initialize Confluence service (optional)
-            self._initialize_confluence()
+                # Initialize template (required)
+                self._initialize_template()
 
-            # Initialize JIRA service (only needed for live mode)
-            if not self.config.use_static_tickets:
-                if not self._initialize_jira():
+                llm_future.result()
+                confluence_future.result()
+                if jira_future is not None and not jira_future.result():
                     return False
 
+            # The handler needs both the LLM and Confluence services
+            self._initialize_confluence_handler()
+
             logger.info("Agent initialization complete")
             return True
 
         except Exception as e:
-            logger.error(f"Failed to initialize agent: {e}", exc_info=True)
+            logger.error("Failed to initialize agent: %s", e, exc_info=True)
             return False
 
     def _initialize_llm(self) -> None:
         """Initialize the LLM service."""
+        from ..agent import llm
+        from ..agent.llm_cache import LLMCache, MemoryBackend, DiskBackend
+
         if self.config.llm_provider == "bedrock":
             # Initialize AWS Bedrock provider
             if not self.config.aws_region:
@@ -79,43 +131,83 @@ class JiraAgent:
                     "Example: us.anthropic.claude-3-5-haiku-20241022-v1:0"
                 )
 
-            llm_provider = llm.BedrockProvider(
+            llm_provider = llm.get_provider(
+                llm.BedrockProvider,
                 region=self.config.aws_region,
                 inference_profile=self.config.bedrock_inference_profile,
                 access_key_id=self.config.aws_access_key_id,
                 secret_access_key=self.config.aws_secret_access_key,
+                latency_optimized=self.config.bedrock_latency_optimized,
+                prompt_caching=self.config.bedrock_prompt_caching,
             )
             logger.info(
-                f"LLM service initialized (Bedrock: {self.config.bedrock_inference_profile})"
+                "LLM service initialized (Bedrock: %s)",
+                self.config.bedrock_inference_profile,
             )
         else:
             # Default to OpenAI provider
             if not self.config.openai_api_key:
                 raise ValueError("OPENAI_API_KEY is required")
 
-            llm_provider = llm.OpenAIProvider(
+            llm_provider = llm.get_provider(
+                llm.OpenAIProvider,
                 api_key=self.config.openai_api_key,
                 base_url=self.config.openai_base_url,
                 model=self.config.openai_model or "gpt-4.1-2025-04-14",
             )
             logger.info("LLM service initialized (OpenAI)")
 
-        self.llm_service = llm.LLM(provider=llm_provider)
+        cache = None
+        if self.config.llm_cache_enabled:
+            ttl = self.config.llm_cache_ttl or None
+            if self.config.llm_cache_path:
+                cache = LLMCache(
+                    backend=DiskBackend(self.config.llm_cache_path), ttl=ttl
+                )
+                logger.info(
+                    "LLM response cache enabled (%s)", self.config.llm_cache_path
+                )
+            else:
+                cache = LLMCache(backend=MemoryBackend(), ttl=ttl)
+                logger.info("LLM response cache enabled (in-memory)")
+
+        self.llm_service = llm.LLM(provider=llm_provider, cache=cache)
 
     def _initialize_template(self) -> None:
         """Initialize the prompt template."""
-        system_prompt, instruction_text, examples = load_prompt_values(
+        from ..prompts import PromptTemplate
+
+        self.template = PromptTemplate.from_file(
             env_var="PROMPT_TICKET_ANALYZER", default_filename="ticket_analyzer.prompt"
         )
-        self.template = PromptTemplate(
-            system_prompt=system_prompt,
-            instruction_template=instruction_text,
-        )
-        self.ticket_analyzer_examples = examples
+        self.ticket_analyzer_examples = self.template.examples
         logger.debug("Prompt template initialized")
 
+    def reload_prompts(self) -> None:
+        """
+        Re-read the prompt files, e.g. after editing them.
+
+        Prompt override variables are resolved again and unchanged files are
+        served from the template cache. A prompt file that fails to load is
+        logged and the previous prompts stay in use.
+        """
+        from ..prompts import clear_prompt_paths
+
+        clear_prompt_paths()
+        try:
+            self._initialize_template()
+            if self.confluence_handler:
+                self.confluence_handler.reload_prompts()
+        except Exception as e:
+            logger.error("Failed to reload prompts: %s", e)
+            return
+        logger.info("Prompts reloaded")
+
     def _initialize_confluence(self) -> None:
         """Initialize Confluence service if credentials are available."""
+        from ..atlassian import confluence
+        from ..utils.cache import DiskBackend
+
         if not all(
             [
                 self.config.confluence_server,
@@ -132,16 +224,26 @@ class JiraAgent:
                 self.config.confluence_email,
                 self.config.confluence_token,
                 self.config.confluence_space,
+                cache_ttl=self.config.confluence_cache_ttl,
+                page_cache_ttl=self.config.confluence_page_cache_ttl,
+                persistent_cache=(
+                    DiskBackend(self.config.confluence_cache_path)
+                    if self.config.confluence_cache_path
+                    else None
+                ),
             )
 
-            if self.confluence_service.test_connection():
+            key = _credential_key(
+                "confluence",
+                self.config.confluence_server,
+                self.config.confluence_email,
+                self.config.confluence_token,
+            )
+            if _recently_verified(key):
+                logger.info("Confluence service initialized (recently verified)")
+            elif self.confluence_service.test_connection():
+                _VERIFIED_CONNECTIONS[key] = time.monotonic()
                 logger.info("Confluence service initialized successfully")
-                # Initialize the Confluence handler with both services
-                if self.llm_service:
-                    self.confluence_handler = ConfluenceHandler(
-                        self.confluence_service,
-                        self.llm_service,
-                    )
             else:
                 logger.warning(
                     "Confluence connection test failed, disabling integration"
@@ -149,9 +251,23 @@ class JiraAgent:
                 self.confluence_service = None
 
         except Exception as e:
-            logger.warning(f"Could not initialize Confluence: {e}")
+            logger.warning("Could not initialize Confluence: %s", e)
             self.confluence_service = None
 
+    def _initialize_confluence_handler(self) -> None:
+        """Initialize the Confluence handler once both services are available."""
+        from .confluence_handler import ConfluenceHandler
+
+        if self.confluence_service and self.llm_service:
+            self.confluence_handler = ConfluenceHandler(
+                self.confluence_service,
+                self.llm_service,
+                query_ticket_budget=self.config.confluence_query_ticket_budget,
+                max_articles=self.config.confluence_max_articles,
+                max_chars_per_article=self.config.confluence_max_chars_per_article,
+                min_ticket_chars=self.config.min_ticket_chars_for_search,
+            )
+
     def _initialize_jira(self) -> bool:
         """
         Initialize JIRA service for live mode.
@@ -159,6 +275,8 @@ class JiraAgent:
         Returns:
             bool: True if successful, False otherwise.
         """
+        from ..atlassian import jira
+
         if not all(
             [
                 self.config.jira_server,
@@ -182,12 +300,24 @@ class JiraAgent:
                 self.config.jira_token,
                 testing_mode=self.config.jira_testing_mode,
             )
-            self.jira_service.test_connection()
+            key = _credential_key(
+                "jira",
+                self.config.jira_server,
+                self.config.jira_email,
+                self.config.jira_token,
+            )
+            if _recently_verified(key):
+                logger.info("JIRA service initialized (recently verified)")
+                return True
+            if not self.jira_service.test_connection():
+                logger.error("JIRA connection test failed")
+                return False
+            _VERIFIED_CONNECTIONS[key] = time.monotonic()
             logger.info("JIRA service initialized successfully")
             return True
 
         except Exception as e:
-            logger.error(f"Failed to connect to JIRA: {e}", exc_info=True)
+            logger.error("Failed to connect to JIRA: %s", e, exc_info=True)
             return False
 
     def search_confluence_for_ticket(
@@ -227,17 +357,20 @@ class JiraAgent:
             The LLM analysis response, or None if processing failed
         """
         try:
-            logger.info(f"Processing ticket: {ticket_key}")
+            logger.info("Processing ticket: %s", ticket_key)
 
             # Search Confluence for relevant articles
             confluence_results = self.search_confluence_for_ticket(ticket_data)
 
             if confluence_results:
                 logger.info(
-                    f"Found {len(confluence_results)} relevant Confluence articles"
+                    "Found %d relevant Confluence articles", len(confluence_results)
                 )
-                for article in confluence_results:
-                    logger.debug(f"  - {article.get('title')} ({article.get('url')})")
+                if logger.isEnabledFor(logging.DEBUG):
+                    for article in confluence_results:
+                        logger.debug(
+                            "  - %s (%s)", article.get("title"), article.get("url")
+                        )
             else:
                 logger.debug("No relevant Confluence articles found")
 
@@ -246,10 +379,13 @@ class JiraAgent:
                 ticket_data=ticket_data,
                 examples=self.ticket_analyzer_examples,
                 confluence_results=confluence_results,
+                content_blocks=self.llm_service.prompt_caching,
             )
 
-            response = self.llm_service.generate_response(prompt=formatted_messages)
-            logger.info(f"Analysis complete for {ticket_key}")
+            response = self.llm_service.generate_response(
+                prompt=formatted_messages, **self.llm_service.deterministic_kwargs
+            )
+            logger.info("Analysis complete for %s", ticket_key)
 
             # Submit to Confluence if requested and service is available
             # Use config setting if submit_to_confluence is not explicitly set
@@ -265,7 +401,7 @@ class JiraAgent:
             return response
 
         except Exception as e:
-            logger.error(f"Error processing ticket {ticket_key}: {e}", exc_info=True)
+            logger.error("Error processing ticket %s: %s", ticket_key, e, exc_info=True)
             return None
 
     def run_static_mode(self) -> None:
@@ -276,20 +412,20 @@ class JiraAgent:
             from ..data.static_tickets.tls_inspection import ticket_data
 
             static_tickets = [ticket_data]  # Add more tickets as needed
-            logger.info(f"Found {len(static_tickets)} static tickets to process")
+            logger.info("Found %d static tickets to process", len(static_tickets))
 
             for ticket in static_tickets:
                 ticket_key = ticket.get("key", "Unknown")
                 response = self.process_ticket(ticket, ticket_key)
 
                 if response:
-                    pprint(response)
+                    print(response)
                     print("-" * 80)
 
         except ImportError as e:
-            logger.error(f"Failed to load static tickets: {e}")
+            logger.error("Failed to load static tickets: %s", e)
         except Exception as e:
-            logger.error(f"Error in static mode: {e}", exc_info=True)
+            logger.error("Error in static mode: %s", e, exc_info=True)
 
     def run_live_mode(self) -> None:
         """Poll JIRA for recently resolved tickets and process them."""
@@ -299,49 +435,278 @@ class JiraAgent:
 
         logger.info("Starting JIRA polling loop...")
         logger.info(
-            f"Polling every {self.config.poll_interval_seconds}s, "
-            f"looking back {self.config.lookback_minutes} minutes"
+            "Polling every %ss (up to %ss when idle), looking back %s minutes",
+            self.config.poll_interval_seconds,
+            max(
+                self.config.poll_interval_seconds, self.config.poll_max_interval_seconds
+            ),
+            self.config.lookback_minutes,
         )
 
-        processed_tickets: Set[Tuple[str, str]] = set()
+        # Bounded LRU of (key, resolutiondate) pairs already handled; only
+        # membership matters, and old entries fall outside the lookback anyway
+        processed_tickets: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+
+        # Start of the last poll that completed; later polls only look back
+        # to it (plus a minute of overlap) instead of the full window
+        last_poll: Optional[float] = None
+
+        # Polls are scheduled on a monotonic clock so slow batches don't
+        # stretch the cadence and wall-clock adjustments don't disturb it;
+        # this is when the current poll was due
+        deadline = time.monotonic()
+
+        # Quiet polls stretch the interval towards the maximum; a poll that
+        # finds new tickets resets it. Nothing is missed while backed off,
+        # since the next poll's window reaches back to the last one
+        interval: float = self.config.poll_interval_seconds
+
+        # Tickets in a batch are independent, so process them concurrently;
+        # the pool size also bounds concurrent LLM and Confluence traffic
+        with ThreadPoolExecutor(
+            max_workers=max(1, self.config.max_concurrent_tickets)
+        ) as ticket_pool:
+            while not self._shutdown.is_set():
+                try:
+                    poll_started = time.monotonic()
+                    issues = self._fetch_resolved(
+                        self._poll_window(last_poll, poll_started), poll_started
+                    )
+
+                    # A ResolvedIssue is already the (key, resolutiondate) pair
+                    new_keys = [
+                        issue.key
+                        for issue in issues
+                        if self._claim_ticket(processed_tickets, issue)
+                    ]
+
+                    # Wait for the whole batch, so a ticket is never picked up
+                    # again while it is still being processed
+                    self._process_batch(ticket_pool, new_keys)
+                    last_poll = poll_started
+
+                    # Decided before scheduling, so a backoff or reset
+                    # applies to the wait that follows this poll
+                    interval = self._next_interval(interval, bool(new_keys))
+
+                except Exception as e:
+                    logger.error("Error in polling loop: %s", e, exc_info=True)
+                    logger.info("Continuing after error...")
+
+                deadline = self._wait_until(deadline + interval, interval)
+
+        logger.info("Shutting down gracefully...")
+
+    def run_webhook_mode(self) -> None:
+        """Process tickets as JIRA reports their resolution via webhook."""
+        from .webhook import WEBHOOK_PATH, make_server
+
+        if not self.jira_service:
+            logger.error("JIRA service not initialized, cannot run webhook mode")
+            return
+
+        processed_tickets: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+        # Webhook requests are handled on separate threads
+        processed_lock = threading.Lock()
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, self.config.max_concurrent_tickets)
+        ) as ticket_pool:
+
+            def on_issue(issue: Dict[str, Any]) -> None:
+                ticket_id = (issue["key"], issue["fields"]["resolutiondate"])
+                with processed_lock:
+                    if not self._claim_ticket(processed_tickets, ticket_id):
+                        return
+                ticket_pool.submit(self._process_issue, issue["key"])
 
-        while True:
             try:
-                project_key = self.config.jira_project_key
-                issues = self.jira_service.fetch_recently_resolved(
-                    project_key=project_key,
-                    lookback_minutes=self.config.lookback_minutes,
+                server = make_server(
+                    self.config.webhook_host,
+                    self.config.webhook_port,
+                    on_issue,
+                    secret=self.config.webhook_secret,
+                    project_key=self.config.jira_project_key,
                 )
+            except ValueError as e:
+                logger.error("Cannot start webhook mode: %s", e)
+                return
+            logger.info(
+                "Listening for JIRA webhooks on %s:%s%s",
+                self.config.webhook_host,
+                self.config.webhook_port,
+                WEBHOOK_PATH,
+            )
+
+            server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+            server_thread.start()
+            try:
+                self._shutdown.wait()
+            finally:
+                server.shutdown()
+                server.server_close()
+
+        logger.info("Shutting down gracefully...")
+
+    def _claim_ticket(
+        self,
+        processed_tickets: "OrderedDict[Tuple[str, str], None]",
+        ticket_id: Tuple[str, str],
+    ) -> bool:
+        """
+        Record a (key, resolutiondate) pair as handled.
+
+        Returns:
+            False if the pair was already handled (never in testing mode,
+            which re-processes every ticket)
+        """
+        if self.config.jira_testing_mode:
+            return True
+        if ticket_id in processed_tickets:
+            processed_tickets.move_to_end(ticket_id)
+            return False
+        processed_tickets[ticket_id] = None
+        if len(processed_tickets) > MAX_PROCESSED_TICKETS:
+            processed_tickets.popitem(last=False)
+        return True
+
+    def _poll_window(self, last_poll: Optional[float], now: float) -> int:
+        """
+        Minutes the next resolved-ticket query should look back.
+
+        The first poll, and every poll in testing mode, covers the configured
+        lookback. Afterwards the window only spans the time since the last
+        completed poll, rounded up with a minute of overlap; JQL's relative
+        dates have minute precision, and the processed-ticket set absorbs the
+        overlap.
+        """
+        if last_poll is None or self.config.jira_testing_mode:
+            return self.config.lookback_minutes
+        return math.ceil((now - last_poll) / 60) + 1
+
+    def _fetch_resolved(
+        self, lookback_minutes: int, poll_started: float
+    ) -> List["jira.ResolvedIssue"]:
+        """
+        Every issue resolved within the window, fetched page by page.
+
+        last_poll only advances once a poll has seen the whole window, so a
+        window with more resolutions than one page must not be cut short.
+
+        JIRA evaluates the relative window afresh for every page, so each
+        page's window is widened by the time spent paging. Its start never
+        moves past where the poll began, and no issue drops out in front of
+        the next offset. Results are ordered by resolution date, so issues
+        that enter the window land on later pages or push already-seen ones
+        forward; those repeats are dropped.
+
+        Args:
+            lookback_minutes: Window of the poll, relative to poll_started
+            poll_started: Monotonic time the poll began
+        """
+        page_size = max(1, self.config.jira_page_size)
+        issues: Dict["jira.ResolvedIssue", None] = {}
+        received = 0
+        while True:
+            elapsed = time.monotonic() - poll_started
+            page = self.jira_service.fetch_recently_resolved(
+                project_key=self.config.jira_project_key,
+                lookback_minutes=lookback_minutes + math.ceil(elapsed / 60),
+                max_results=page_size,
+                start_at=received,
+            )
+            received += len(page)
+            issues.update(dict.fromkeys(page))
+            if len(page) < page_size:
+                return list(issues)
+
+    def _process_batch(self, ticket_pool: ThreadPoolExecutor, keys: List[str]) -> None:
+        """
+        Fetch a poll's new tickets in bulk and process them concurrently.
+
+        If the bulk request fails, each ticket is fetched on its own instead,
+        so one bad request doesn't drop the whole batch.
+        """
+        if not keys:
+            return
+        try:
+            full_tickets = self.jira_service.get_tickets_bulk(keys)
+        except Exception as e:
+            logger.warning("Bulk ticket fetch failed, fetching one by one: %s", e)
+            list(ticket_pool.map(self._process_issue, keys))
+            return
+        list(ticket_pool.map(self._process_full_ticket, full_tickets))
+
+    def _process_issue(self, ticket_key: str) -> None:
+        """Fetch a resolved issue's full data and process it."""
+        try:
+            full_ticket = self.jira_service.get_full_ticket(ticket_key)
+        except Exception as e:
+            logger.error("Error fetching ticket %s: %s", ticket_key, e, exc_info=True)
+            return
+        self._process_full_ticket(full_ticket)
 
-                for issue in issues:
-                    ticket_id = (issue.key, issue.fields.resolutiondate)
+    def _process_full_ticket(self, full_ticket: Dict[str, Any]) -> None:
+        """Process a ticket's full data and print the analysis."""
+        ticket_key = full_ticket.get("key", "Unknown")
+        try:
+            response = self.process_ticket(full_ticket, ticket_key)
 
-                    # Skip if already processed (unless in testing mode)
-                    if (
-                        not self.config.jira_testing_mode
-                        and ticket_id in processed_tickets
-                    ):
-                        continue
+            if response:
+                print(response)
 
-                    if not self.config.jira_testing_mode:
-                        processed_tickets.add(ticket_id)
+        except Exception as e:
+            logger.error("Error processing ticket %s: %s", ticket_key, e, exc_info=True)
+
+    def _next_interval(self, interval: float, found_new: bool) -> float:
+        """Seconds until the next poll, given whether this one found tickets."""
+        base = self.config.poll_interval_seconds
+        if found_new:
+            return base
+        return max(
+            base,
+            min(interval * POLL_BACKOFF_FACTOR, self.config.poll_max_interval_seconds),
+        )
 
-                    # Get full ticket data and process
-                    full_ticket = self.jira_service.get_full_ticket(issue.key)
-                    response = self.process_ticket(full_ticket, issue.key)
+    def _wait_until(self, deadline: float, interval: float) -> float:
+        """
+        Sleep until a monotonic deadline, or until shutdown is requested.
+
+        Args:
+            deadline: Monotonic time of the next poll
+            interval: Current poll interval, for the overrun warning
 
-                    if response:
-                        print(response)
+        Returns:
+            The deadline the next poll interval should be counted from; when
+            the poll already overran, that is now, so no catch-up burst follows
+        """
+        remaining = deadline - time.monotonic()
+        if remaining < 0:
+            logger.warning(
+                "Poll overran the %.0fs interval by %.1fs",
+                interval,
+                -remaining,
+            )
+            return time.monotonic()
+        self._shutdown.wait(remaining)
+        return deadline
 
-                time.sleep(self.config.poll_interval_seconds)
+    def stop(self) -> None:
+        """Ask the live-mode loop or webhook server to exit."""
+        self._shutdown.set()
 
-            except KeyboardInterrupt:
-                logger.info("Shutting down gracefully...")
-                break
-            except Exception as e:
-                logger.error(f"Error in polling loop: {e}", exc_info=True)
-                logger.info("Continuing after error...")
-                time.sleep(self.config.poll_interval_seconds)
+    def _install_signal_handlers(self) -> None:
+        """
+        Stop the live or webhook mode on SIGINT/SIGTERM instead of raising,
+        and reload the prompt files on SIGHUP.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            # signal.signal only works on the main thread
+            return
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: self.stop())
+        if hasattr(signal, "SIGHUP"):  # not available on Windows
+            signal.signal(signal.SIGHUP, lambda *_: self.reload_prompts())
 
     def run(self) -> None:
         """Run the agent in the appropriate mode."""
@@ -351,15 +716,23 @@ class JiraAgent:
 
         if self.config.use_static_tickets:
             self.run_static_mode()
+        elif self.config.ingestion_mode == "webhook":
+            self._install_signal_handlers()
+            self.run_webhook_mode()
         else:
+            self._install_signal_handlers()
             self.run_live_mode()
 
 
 def main():
     """Main entry point for the JIRA agent."""
-    load_dotenv()
-
-    config = ServiceConfig.from_env()
+    # Configure logging here rather than at import, so importing JiraAgent
+    # leaves the host application's logging setup alone
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    config = get_config()
     agent = JiraAgent(config)
     agent.run()
 
@@ -0,0 +1,134 @@
+"""HTTP endpoint receiving JIRA issue webhooks."""
+
+import hmac
+import hashlib
+import ipaddress
+import logging
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+from ..utils import fastjson
+
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_PATH = "/jira-webhook"
+
+# JIRA issue payloads are a few KB; anything far larger is not a webhook
+MAX_PAYLOAD_BYTES = 1024 * 1024
+
+
+def resolved_issue(
+    payload: Any, project_key: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Return the issue from a webhook payload if it is resolved.
+
+    Args:
+        payload: Decoded webhook JSON
+        project_key: Only accept issues of this project (None = any); an
+            issue whose payload names no project is accepted
+
+    Returns:
+        The payload's issue dict, or None if there is no resolved issue
+    """
+    if not isinstance(payload, dict):
+        return None
+    issue = payload.get("issue")
+    if not isinstance(issue, dict) or not issue.get("key"):
+        return None
+    fields = issue.get("fields") or {}
+    if not fields.get("resolutiondate"):
+        return None
+    project = (fields.get("project") or {}).get("key")
+    if project_key and project and project != project_key:
+        return None
+    return issue
+
+
+def is_loopback(host: str) -> bool:
+    """Whether a listen address only accepts connections from this machine."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def make_server(
+    host: str,
+    port: int,
+    on_issue: Callable[[Dict[str, Any]], None],
+    secret: Optional[str] = None,
+    project_key: Optional[str] = None,
+) -> ThreadingHTTPServer:
+    """
+    Build a server that hands resolved issues from JIRA webhooks to a callback.
+
+    Requests are acknowledged with 202 before any processing, so JIRA never
+    waits on the LLM; `on_issue` should only queue the work.
+
+    Args:
+        host: Interface to listen on
+        port: Port to listen on
+        on_issue: Called with the issue dict of every resolved-issue event
+        secret: Webhook secret; when set, requests must carry a matching
+            X-Hub-Signature (HMAC-SHA256 of the body). Required unless the
+            server only listens on a loopback address
+        project_key: Ignore issues of other projects (None = accept any)
+
+    Returns:
+        The bound server; call serve_forever() to start handling requests
+
+    Raises:
+        ValueError: If host is reachable from other machines and no secret
+            is set, since any POST would then trigger LLM and Confluence work
+    """
+    if not secret and not is_loopback(host):
+        raise ValueError(
+            f"Refusing to listen on {host} without WEBHOOK_SECRET; set a "
+            "secret or listen on 127.0.0.1 behind a proxy"
+        )
+    key = secret.encode() if secret else None
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            if self.path.split("?", 1)[0] != WEBHOOK_PATH:
+                self.send_error(HTTPStatus.NOT_FOUND)
+                return
+
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+            except ValueError:
+                length = -1
+            if not 0 < length <= MAX_PAYLOAD_BYTES:
+                self.send_error(HTTPStatus.BAD_REQUEST)
+                return
+            body = self.rfile.read(length)
+
+            if key is not None:
+                expected = "sha256=" + hmac.new(key, body, hashlib.sha256).hexdigest()
+                received = self.headers.get("X-Hub-Signature", "")
+                if not hmac.compare_digest(expected, received):
+                    self.send_error(HTTPStatus.UNAUTHORIZED)
+                    return
+
+            try:
+                payload = fastjson.loads(body)
+            except fastjson.JSONDecodeError:
+                self.send_error(HTTPStatus.BAD_REQUEST)
+                return
+
+            self.send_response(HTTPStatus.ACCEPTED)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+            issue = resolved_issue(payload, project_key)
+            if issue is not None:
+                on_issue(issue)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug("%s - " + format, self.address_string(), *args)
+
+    return ThreadingHTTPServer((host, port), Handler)
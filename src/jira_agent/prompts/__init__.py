@@ -1,6 +1,7 @@
-from .templates import PromptTemplate, load_prompt_values
+from .templates import PromptTemplate, clear_prompt_paths, load_prompt_values
 
 __all__ = [
     "PromptTemplate",
+    "clear_prompt_paths",
     "load_prompt_values",
 ]
@@ -1,14 +1,210 @@
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+import itertools
 import os
+import re
+import sys
+from types import MappingProxyType
+from functools import lru_cache
 from pathlib import Path
 
 
+def _field(value: Any, name: str) -> Any:
+    """Read a key from a nested JIRA object, or "" if it is not a dict."""
+    return value.get(name, "") if isinstance(value, dict) else ""
+
+
+def _status_name(value: Any) -> Optional[str]:
+    """Name of a status-like field: its "name" if a dict, else str(value) if set."""
+    if isinstance(value, dict):
+        return value.get("name")
+    return str(value) if value else None
+
+
+def _author_name(item: Mapping[str, Any]) -> str:
+    """Display name of a comment's or attachment's author, or ""."""
+    return _field(item.get("author"), "displayName")
+
+
+# Longest comment body passed to the LLM, in characters after stripping
+MAX_COMMENT_CHARS = 1000
+
+_NON_SPACE = re.compile(r"\S")
+
+# (divisor, suffix) by binary order of magnitude: <1 KiB, <1 MiB, larger
+_SIZE_UNITS = ((1, "B"), (1 << 10, "KB"), (1 << 20, "MB"))
+
+
+def _format_size(size: int) -> str:
+    """Render a byte count as whole B, KB or MB."""
+    divisor, suffix = _SIZE_UNITS[min(max(size.bit_length() - 1, 0) // 10, 2)]
+    return f"{size // divisor}{suffix}"
+
+
+def _comment_line(comment: Any) -> str:
+    """Render one JIRA comment as a "- author (created): body" line."""
+    if isinstance(comment, dict):
+        author = _author_name(comment)
+        body = comment.get("body")
+        created_date = comment.get("created", "")
+    else:
+        author = body = None
+        created_date = ""
+    body_content = ""
+    if body and isinstance(body, str):
+        # Include full comment content, not just first line, but truncate
+        # very long comments. The stripped body only exceeds the limit if
+        # there is non-space text past it, so a long body is sliced without
+        # first copying all of it through strip()
+        first = _NON_SPACE.search(body)
+        if first is not None:
+            start = first.start()
+            if _NON_SPACE.search(body, start + MAX_COMMENT_CHARS):
+                body_content = body[start : start + MAX_COMMENT_CHARS] + "..."
+            else:
+                body_content = body.strip()
+    return f"- {author or 'Unknown'} ({created_date}): {body_content}"
+
+
+def _article_entry(article: Dict[str, Any], number: int) -> str:
+    """Render one Confluence search result as a numbered entry."""
+    content = article.get("content")
+    return (
+        f"\n{number}. {article.get('title', 'Unknown')}\n"
+        f"   Space: {article.get('space', 'Unknown')}\n"
+        f"   URL: {article.get('url', 'N/A')}\n"
+        + (f"   Content: {content}\n" if content else "")
+    )
+
+
 class PromptTemplate:
     """Base class for managing prompt templates with ticket-data separation."""
 
-    def __init__(self, system_prompt: str, instruction_template: str):
-        self.system_prompt = system_prompt.strip()
-        self.instruction_template = instruction_template.strip()
+    __slots__ = (
+        "system_prompt",
+        "instruction_template",
+        "examples",
+        "_prefix_cache",
+        "_instructions_prefix",
+    )
+
+    def __init__(
+        self,
+        system_prompt: str,
+        instruction_template: str,
+        examples: Optional[Sequence[Mapping[str, Any]]] = None,
+    ):
+        self._assign(system_prompt.strip(), instruction_template.strip(), examples)
+
+    @classmethod
+    def from_trusted(
+        cls,
+        system_prompt: str,
+        instruction_template: str,
+        examples: Optional[Sequence[Mapping[str, Any]]] = None,
+    ) -> "PromptTemplate":
+        """
+        Build a template from texts that are already stripped.
+
+        Used for prompt files, whose sections the loader strips; other
+        callers should use the constructor.
+
+        Args:
+            system_prompt: Stripped system prompt
+            instruction_template: Stripped instruction template
+            examples: Optional few-shot examples
+
+        Returns:
+            The new template
+        """
+        template = cls.__new__(cls)
+        template._assign(system_prompt, instruction_template, examples)
+        return template
+
+    def _assign(
+        self,
+        system_prompt: str,
+        instruction_template: str,
+        examples: Optional[Sequence[Mapping[str, Any]]],
+    ) -> None:
+        self.system_prompt = system_prompt
+        self.instruction_template = instruction_template
+        # Few-shot examples used when format_messages is not given any
+        self.examples = examples
+        # (examples, messages) of the last static prefix built; the same
+        # examples object is passed for every ticket
+        self._prefix_cache: Optional[
+            Tuple[Optional[Sequence[Mapping[str, Any]]], Tuple[Dict[str, str], ...]]
+        ] = None
+        # Final user message text up to the ticket context, for calls that
+        # add nothing to the instructions
+        self._instructions_prefix = (
+            f"## Instructions\n{self.instruction_template}\n\n## Ticket Context\n"
+        )
+
+    @classmethod
+    def from_file(cls, env_var: str, default_filename: str) -> "PromptTemplate":
+        """
+        Build the template for a prompt file, including its few-shot examples.
+
+        Instances are shared while the file is unchanged, so repeated calls
+        neither re-read the file nor rebuild the static message prefix.
+
+        Args:
+            env_var: Environment variable name that can override the prompt file path.
+            default_filename: File name under the repository-level "prompts/" directory.
+
+        Returns:
+            The (possibly shared) template
+        """
+        return _template_for(*_stat_prompt_file(env_var, default_filename))
+
+    def immutable_chunks(self) -> List[str]:
+        """
+        Texts that are byte-identical in every render of this template.
+
+        The order matches the messages from format_messages: the system
+        prompt, then each few-shot example's content. None of them passes
+        through str.format, so a backend with position-independent caching
+        can reuse each chunk even where the text around it differs.
+
+        Returns:
+            The system prompt followed by the few-shot contents, in order
+        """
+        return [
+            self.system_prompt,
+            *(example["content"] for example in self.examples or ()),
+        ]
+
+    def _static_prefix(
+        self, examples: Optional[Sequence[Mapping[str, Any]]]
+    ) -> Tuple[Dict[str, str], ...]:
+        """
+        System message and few-shot examples, validated and built once.
+
+        The messages are shared between calls and must not be mutated.
+        """
+        cached = self._prefix_cache
+        if cached is not None and cached[0] is examples:
+            return cached[1]
+
+        messages = [{"role": "system", "content": self.system_prompt}]
+
+        # Add few-shot examples if provided - these are static and cacheable
+        if examples:
+            for example in examples:
+                # Only handle standard message format: {"role": "user/assistant", "content": "..."}
+                if "role" in example and "content" in example:
+                    messages.append(
+                        {"role": example["role"], "content": example["content"]}
+                    )
+                else:
+                    raise ValueError(
+                        f"Invalid example format. Expected 'role' and 'content' keys, got: {list(example.keys())}"
+                    )
+
+        prefix = tuple(messages)
+        self._prefix_cache = (examples, prefix)
+        return prefix
 
     def _format_ticket_context(self, ticket_data: Dict[str, Any]) -> str:
         """Render a comprehensive ticket summary from raw dict data."""
@@ -16,83 +212,45 @@ class PromptTemplate:
         fields = (
             ticket_data.get("fields", {}) if "fields" in ticket_data else ticket_data
         )
+        get = fields.get
 
-        summary = fields.get("summary", "")
-        description = fields.get("description", "") or ""
-
-        # Get resolution details
-        resolution = fields.get("resolution", {}) or {}
-        resolution_name = (
-            resolution.get("name") if isinstance(resolution, dict) else str(resolution)
-        )
-        resolution_description = (
-            resolution.get("description", "") if isinstance(resolution, dict) else ""
-        )
+        summary = get("summary", "")
+        description = get("description", "") or ""
 
-        # Get status details
-        status = fields.get("status", {}) or {}
-        status_name = status.get("name") if isinstance(status, dict) else str(status)
+        # Get resolution and status details
+        resolution = get("resolution")
+        resolution_name = _status_name(resolution)
+        resolution_description = _field(resolution, "description")
+        status_name = _status_name(get("status"))
 
-        # Get assignee and reporter
-        assignee = fields.get("assignee", {}) or {}
-        assignee_name = (
-            assignee.get("displayName", "") if isinstance(assignee, dict) else ""
-        )
-        reporter = fields.get("reporter", {}) or {}
-        reporter_name = (
-            reporter.get("displayName", "") if isinstance(reporter, dict) else ""
-        )
-
-        # Get priority and issue type
-        priority = fields.get("priority", {}) or {}
-        priority_name = priority.get("name", "") if isinstance(priority, dict) else ""
-        issuetype = fields.get("issuetype", {}) or {}
-        issuetype_name = (
-            issuetype.get("name", "") if isinstance(issuetype, dict) else ""
-        )
+        # Get assignee, reporter, priority and issue type
+        assignee_name = _field(get("assignee"), "displayName")
+        reporter_name = _field(get("reporter"), "displayName")
+        priority_name = _field(get("priority"), "name")
+        issuetype_name = _field(get("issuetype"), "name")
 
         # Get labels and components
-        labels = fields.get("labels", []) or []
-        components = fields.get("components", []) or []
+        labels = get("labels") or ()
         component_names = [
-            comp.get("name", "") for comp in components if isinstance(comp, dict)
+            comp.get("name", "")
+            for comp in get("components") or ()
+            if isinstance(comp, dict)
         ]
 
         # Get timestamps
-        created = fields.get("created", "")
-        updated = fields.get("updated", "")
-        resolved = fields.get("resolutiondate", "")
+        created = get("created", "")
+        updated = get("updated", "")
+        resolved = get("resolutiondate", "")
 
         # Get comments with full content
-        comments_container = fields.get("comment", {}) or {}
+        comments_container = get("comment")
         comments = (
             comments_container.get("comments", [])
             if isinstance(comments_container, dict)
             else []
         )
-        comment_summaries = []
-        for c in comments:
-            author = (
-                (c.get("author", {}) or {}).get("displayName")
-                if isinstance(c, dict)
-                else None
-            )
-            body = c.get("body") if isinstance(c, dict) else None
-            created_date = c.get("created", "") if isinstance(c, dict) else ""
-            if body and isinstance(body, str):
-                # Include full comment content, not just first line
-                body_content = body.strip()
-                # Truncate very long comments but keep more content
-                if len(body_content) > 1000:
-                    body_content = body_content[:1000] + "..."
-            else:
-                body_content = ""
-            comment_summaries.append(
-                f"- {author or 'Unknown'} ({created_date}): {body_content}"
-            )
-
         # Get attachment metadata only (not full content)
-        attachments = fields.get("attachment", []) or []
+        attachments = get("attachment") or ()
         attachment_info = []
         for att in attachments:
             if isinstance(att, dict):
@@ -100,20 +258,12 @@ class PromptTemplate:
                 size = att.get("size", "")
                 mimetype = att.get("mimeType", "")
                 created_date = att.get("created", "")
-                author = (att.get("author", {}) or {}).get("displayName", "")
+                author = _author_name(att)
 
                 info_parts = [filename]
-                if size:
-                    # Convert bytes to human readable format
-                    if isinstance(size, (int, str)) and str(size).isdigit():
-                        size_int = int(size)
-                        if size_int < 1024:
-                            size_str = f"{size_int}B"
-                        elif size_int < 1024 * 1024:
-                            size_str = f"{size_int // 1024}KB"
-                        else:
-                            size_str = f"{size_int // (1024 * 1024)}MB"
-                        info_parts.append(size_str)
+                # Convert bytes to human readable format
+                if size and isinstance(size, (int, str)) and str(size).isdigit():
+                    info_parts.append(_format_size(int(size)))
                 if mimetype:
                     info_parts.append(mimetype)
                 if author:
@@ -123,77 +273,99 @@ class PromptTemplate:
 
                 attachment_info.append(" - ".join(info_parts))
 
-        # Build comprehensive ticket context
-        lines = [
-            f"Key: {key}",
-            f"Summary: {summary}",
-            f"Issue Type: {issuetype_name}",
-            f"Status: {status_name}",
-            f"Resolution: {resolution_name}",
-        ]
-
-        if resolution_description:
-            lines.append(f"Resolution Description: {resolution_description}")
-
-        lines.extend(
-            [
-                f"Priority: {priority_name}",
-                f"Reporter: {reporter_name}",
-                f"Assignee: {assignee_name}",
-                f"Created: {created}",
-                f"Updated: {updated}",
-                f"Resolved: {resolved}",
-            ]
+        # Build comprehensive ticket context: the fixed-shape fields in one
+        # f-string, with the optional sections spliced in as ready-made text
+        resolution_description_line = (
+            f"Resolution Description: {resolution_description}\n"
+            if resolution_description
+            else ""
+        )
+        labels_line = f"Labels: {', '.join(labels)}\n" if labels else ""
+        components_line = (
+            f"Components: {', '.join(component_names)}\n" if component_names else ""
+        )
+        attachments_section = (
+            f"Attachments ({len(attachment_info)}):\n"
+            + "".join(f"- {info}\n" for info in attachment_info)
+            if attachment_info
+            else ""
         )
 
-        if labels:
-            lines.append(f"Labels: {', '.join(labels)}")
-
-        if component_names:
-            lines.append(f"Components: {', '.join(component_names)}")
-
-        if attachment_info:
-            lines.append(f"Attachments ({len(attachment_info)}):")
-            lines.extend([f"- {info}" for info in attachment_info])
-
-        lines.append("Description:")
         if isinstance(description, str) and description:
             # Keep more of the description content
             if len(description) > 5000:
-                lines.append(description[:5000] + "...")
-            else:
-                lines.append(description)
+                description = description[:5000] + "..."
         else:
-            lines.append("No description provided")
-
-        if comment_summaries:
-            lines.append(f"Comments ({len(comment_summaries)}):")
-            lines.extend(comment_summaries)
+            description = "No description provided"
+
+        # Every comment renders as one line, so the count is known up front
+        # and the lines go straight into the join
+        comments_section = (
+            f"\nComments ({len(comments)}):\n" + "\n".join(map(_comment_line, comments))
+            if comments
+            else ""
+        )
 
-        return "\n".join(lines)
+        return (
+            f"Key: {key}\n"
+            f"Summary: {summary}\n"
+            f"Issue Type: {issuetype_name}\n"
+            f"Status: {status_name}\n"
+            f"Resolution: {resolution_name}\n"
+            f"{resolution_description_line}"
+            f"Priority: {priority_name}\n"
+            f"Reporter: {reporter_name}\n"
+            f"Assignee: {assignee_name}\n"
+            f"Created: {created}\n"
+            f"Updated: {updated}\n"
+            f"Resolved: {resolved}\n"
+            f"{labels_line}"
+            f"{components_line}"
+            f"{attachments_section}"
+            f"Description:\n{description}"
+            f"{comments_section}"
+        )
 
     def format_messages(
         self,
         ticket_data: Dict[str, Any],
-        examples: List[Dict[str, Any]] = None,
+        examples: Optional[Sequence[Mapping[str, Any]]] = None,
         confluence_results: List[Dict[str, Any]] = None,
+        content_blocks: bool = False,
+        dynamic_payload: Optional[str] = None,
         **kwargs,
-    ) -> List[Dict[str, str]]:
-        """Format as messages array for multi-shot prompting with prompt caching optimization."""
-        messages = [{"role": "system", "content": self.system_prompt}]
-
-        # Add few-shot examples if provided - these are static and cacheable
-        if examples:
-            for example in examples:
-                # Only handle standard message format: {"role": "user/assistant", "content": "..."}
-                if "role" in example and "content" in example:
-                    messages.append(
-                        {"role": example["role"], "content": example["content"]}
-                    )
-                else:
-                    raise ValueError(
-                        f"Invalid example format. Expected 'role' and 'content' keys, got: {list(example.keys())}"
-                    )
+    ) -> List[Dict[str, Any]]:
+        """
+        Format as messages array for multi-shot prompting with prompt caching optimization.
+
+        With content_blocks=True the final user message is a list of text
+        blocks: the static instructions, the ticket context, and, when there
+        is any, a last block with the Confluence results and dynamic_payload.
+        A provider can place prompt-cache breakpoints after the instructions
+        and after the ticket, so re-running a ticket against different search
+        results still reuses the ticket. The blocks' text joined together
+        equals the plain-string content.
+
+        Per-call text belongs in dynamic_payload, which is appended after the
+        ticket context. Passing kwargs instead renders them into the
+        instructions, which changes the cacheable prefix on every call.
+        """
+        # The system prompt and examples are the same for every ticket
+        if examples is None:
+            examples = self.examples
+        messages = list(self._static_prefix(examples))
+
+        # Common shape: one plain-string message of prebuilt instructions
+        # followed by the ticket
+        if not (kwargs or confluence_results or content_blocks or dynamic_payload):
+            messages.append(
+                {
+                    "role": "user",
+                    "content": self._instructions_prefix
+                    + self._format_ticket_context(ticket_data),
+                }
+            )
+            return messages
 
         # Add instructions first (static and cacheable)
         instructions = (
@@ -209,28 +381,54 @@ class PromptTemplate:
         # Format Confluence results if provided
         confluence_context = ""
         if confluence_results:
-            confluence_context = "\n\n## Existing Confluence Articles\n"
-            confluence_context += (
+            confluence_context = (
+                "\n\n## Existing Confluence Articles\n"
                 f"Found {len(confluence_results)} potentially relevant articles:\n"
+                + "".join(map(_article_entry, confluence_results, itertools.count(1)))
             )
-            for i, article in enumerate(confluence_results, 1):
-                confluence_context += f"\n{i}. {article.get('title', 'Unknown')}\n"
-                confluence_context += f"   Space: {article.get('space', 'Unknown')}\n"
-                confluence_context += f"   URL: {article.get('url', 'N/A')}\n"
-                if article.get("content"):
-                    confluence_context += f"   Content: {article.get('content')}\n"
 
         # Final user message with all context
-        messages.append(
-            {
-                "role": "user",
-                "content": f"## Instructions\n{instructions}\n\n## Ticket Context\n{ticket_context}{confluence_context}",
-            }
-        )
+        static_part = f"## Instructions\n{instructions}\n\n"
+        ticket_part = f"## Ticket Context\n{ticket_context}"
+        # Retrieval results and per-call text change more often than the
+        # ticket, so they come last
+        dynamic_part = confluence_context
+        if dynamic_payload:
+            dynamic_part += f"\n\n{dynamic_payload}"
+        if content_blocks:
+            content: Any = [
+                {"type": "text", "text": static_part},
+                {"type": "text", "text": ticket_part},
+            ]
+            if dynamic_part:
+                content.append({"type": "text", "text": dynamic_part})
+        else:
+            content = static_part + ticket_part + dynamic_part
+        messages.append({"role": "user", "content": content})
 
         return messages
 
 
+# Section headings ("# system") and few-shot turn markers ("> user")
+_SECTION_RE = re.compile(r"^# (.*)$", re.MULTILINE)
+_TURN_RE = re.compile(r"^> (.*)$", re.MULTILINE)
+
+
+def _split_on_headings(
+    text: str, heading_re: re.Pattern
+) -> Iterator[Tuple[str, Optional[str]]]:
+    """Yield (heading, body) per heading line; body is None if no lines follow.
+
+    Text before the first heading is dropped. Each body runs up to the line
+    before the next heading.
+    """
+    matches = list(heading_re.finditer(text))
+    for match, following in zip(matches, matches[1:] + [None]):
+        start = match.end() + 1
+        end = following.start() - 1 if following else len(text)
+        yield match.group(1), (text[start:end] if start <= end else None)
+
+
 def _parse_prompt_file(path: Path) -> Tuple[Dict[str, List[str]], List[Dict[str, str]]]:
     """Parse a .prompt file into sections and few-shot messages.
 
@@ -238,71 +436,56 @@ def _parse_prompt_file(path: Path) -> Tuple[Dict[str, List[str]], List[Dict[str,
       - "# system"
       - "# instructions"
       - "# few-shot" with message blocks introduced by lines starting with "> ROLE".
+
+    Headings are located with a regex sweep and each section is sliced out
+    whole, instead of walking the file line by line.
     """
     sections: Dict[str, List[str]] = {"system": [], "instructions": []}
     messages: List[Dict[str, str]] = []
-    current_section: str | None = None
-    current_message: Dict[str, Any] | None = None
 
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if line.startswith("# "):
-            if current_section == "few-shot" and current_message:
+    # Normalize line endings the way splitlines() recognizes them, so the
+    # anchors below only have to deal with "\n"
+    text = "\n".join(path.read_text(encoding="utf-8").splitlines())
+
+    for heading, body in _split_on_headings(text, _SECTION_RE):
+        if body is None:
+            continue
+        section = heading.strip().lower()
+        if section == "few-shot":
+            for role, content in _split_on_headings(body, _TURN_RE):
                 messages.append(
-                    {
-                        "role": current_message["role"],
-                        "content": "\n".join(current_message["lines"]).strip(),
-                    }
+                    {"role": role.strip(), "content": (content or "").strip()}
                 )
-                current_message = None
-            current_section = line[2:].strip().lower()
-            continue
+        elif section in sections:
+            sections[section].append(body)
 
-        if current_section == "few-shot":
-            if line.startswith("> "):
-                if current_message:
-                    messages.append(
-                        {
-                            "role": current_message["role"],
-                            "content": "\n".join(current_message["lines"]).strip(),
-                        }
-                    )
-                current_message = {"role": line[2:].strip(), "lines": []}
-            elif current_message is not None:
-                current_message["lines"].append(line)
-            continue
+    return sections, messages
 
-        if current_section in sections:
-            sections[current_section].append(line)
 
-    if current_section == "few-shot" and current_message:
-        messages.append(
-            {
-                "role": current_message["role"],
-                "content": "\n".join(current_message["lines"]).strip(),
-            }
-        )
+# Repository-level prompts directory
+_PROMPTS_DIR = Path(__file__).resolve().parents[3] / "prompts"
 
-    return sections, messages
 
+@lru_cache(maxsize=None)
+def _prompt_path(env_var: str, default_filename: str) -> Path:
+    """Resolve a prompt file, honouring its override variable.
 
-def load_prompt_values(
-    env_var: str, default_filename: str
-) -> Tuple[str, str, List[Dict[str, str]]]:
-    """Load system prompt, instruction text, and few-shot examples for a prompt.
+    The override is read once per process; see clear_prompt_paths().
+    """
+    return Path(os.environ.get(env_var) or _PROMPTS_DIR / default_filename)
 
-    Args:
-        env_var: Environment variable name that can override the prompt file path.
-        default_filename: File name under the repository-level "prompts/" directory.
 
-    Returns:
-        Tuple of (system_text, instruction_text, few_shot_messages)
-    """
-    default_path = Path(__file__).resolve().parents[3] / "prompts" / default_filename
-    prompt_path = Path(os.environ.get(env_var) or default_path)
+def clear_prompt_paths() -> None:
+    """Forget resolved prompt paths, so override variables are read again."""
+    _prompt_path.cache_clear()
 
-    if not prompt_path.exists():
-        raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
 
+@lru_cache(maxsize=32)
+def _load_prompt_file(
+    path: str, mtime_ns: int
+) -> Tuple[str, str, Tuple[Mapping[str, str], ...]]:
+    """Parse a prompt file; keyed by mtime, so an edited file is parsed again."""
+    prompt_path = Path(path)
     sections, messages = _parse_prompt_file(prompt_path)
 
     system_text = "\n".join(sections.get("system", [])).strip()
@@ -314,4 +497,44 @@ def load_prompt_values(
     if not instruction_text:
         raise ValueError(f"Instructions section is empty in prompt file: {prompt_path}")
 
-    return system_text, instruction_text, messages
+    # Read-only, since the cached value is shared by every caller
+    examples = tuple(
+        MappingProxyType({"role": sys.intern(m["role"]), "content": m["content"]})
+        for m in messages
+    )
+    return system_text, instruction_text, examples
+
+
+def _stat_prompt_file(env_var: str, default_filename: str) -> Tuple[str, int]:
+    """Return a prompt file's path and modification time."""
+    prompt_path = _prompt_path(env_var, default_filename)
+    try:
+        return str(prompt_path), prompt_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Prompt file not found: {prompt_path}") from None
+
+
+def load_prompt_values(
+    env_var: str, default_filename: str
+) -> Tuple[str, str, Tuple[Mapping[str, str], ...]]:
+    """Load system prompt, instruction text, and few-shot examples for a prompt.
+
+    Parsed files are cached by path and modification time, so repeated calls
+    only stat the file and edits are picked up on the next call. A changed
+    override variable takes effect after clear_prompt_paths().
+
+    Args:
+        env_var: Environment variable name that can override the prompt file path.
+        default_filename: File name under the repository-level "prompts/" directory.
+
+    Returns:
+        Tuple of (system_text, instruction_text, few_shot_messages); the
+        messages are read-only mappings
+    """
+    return _load_prompt_file(*_stat_prompt_file(env_var, default_filename))
+
+
+@lru_cache(maxsize=32)
+def _template_for(path: str, mtime_ns: int) -> PromptTemplate:
+    system_text, instruction_text, examples = _load_prompt_file(path, mtime_ns)
+    return PromptTemplate.from_trusted(system_text, instruction_text, examples=examples)
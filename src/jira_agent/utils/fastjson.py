@@ -0,0 +1,37 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Raised by loads() on malformed input; orjson's error subclasses it
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """
+    Serialize obj to compact UTF-8 JSON bytes.
+
+    The stdlib fallback produces the same compact encoding as orjson, so
+    hashes of the output are stable whether or not orjson is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(
+        obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """
+    Parse JSON from str or bytes.
+
+    Both backends raise JSONDecodeError on malformed input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,49 @@
+"""HTTP session helpers for the Atlassian clients."""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+
+# Only advertise encodings urllib3 can decode here: br requires the brotli
+# package (installed with the "speedups" extra), gzip/deflate are built in.
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+
+def mount_pooled_adapter(
+    session: requests.Session,
+    pool_connections: int = 32,
+    pool_maxsize: int = 64,
+) -> requests.Session:
+    """
+    Give a session a larger keep-alive connection pool and compressed responses.
+
+    The requests default (10 connections per host) makes concurrent callers
+    wait for a free connection or open throwaway ones, each paying a fresh
+    TLS handshake. Large issue and page bodies compress well, so every
+    encoding urllib3 can decode is advertised explicitly.
+
+    Args:
+        session: Session to configure in place
+        pool_connections: Number of per-host pools to keep
+        pool_maxsize: Maximum connections kept alive per host
+
+    Returns:
+        The same session, for chaining
+    """
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    return session
+
+
+def pooled_session(
+    pool_connections: int = 32, pool_maxsize: int = 64
+) -> requests.Session:
+    """Create a new session with a large keep-alive connection pool."""
+    return mount_pooled_adapter(
+        requests.Session(),
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+    )
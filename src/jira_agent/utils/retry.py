@@ -0,0 +1,89 @@
+"""Retry helpers for transient HTTP failures."""
+
+import functools
+import logging
+import random
+import time
+from typing import Any, Callable, Optional, TypeVar
+
+import requests
+
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Rate limiting and gateway errors; other 4xx/5xx responses are not retried
+RETRYABLE_STATUS = frozenset({429, 502, 503, 504})
+
+
+def status_code(exc: BaseException) -> Optional[int]:
+    """Return the HTTP status carried by an exception, if any."""
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        response = getattr(exc, "response", None)
+        status = getattr(response, "status_code", None)
+    return status
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Whether a failed request is worth repeating."""
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+        return True
+    return status_code(exc) in RETRYABLE_STATUS
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    """Seconds requested by a Retry-After header, if the server sent one."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def retry_transient(
+    attempts: int = 5, initial: float = 0.2, maximum: float = 5.0
+) -> Callable[[F], F]:
+    """
+    Retry a call on rate limiting, gateway errors and dropped connections.
+
+    Waits grow exponentially from `initial` with random jitter, capped at
+    `maximum`; a Retry-After header takes precedence (also capped). Any other
+    exception, and the last transient one, is re-raised to the caller.
+
+    Args:
+        attempts: Total number of calls, including the first
+        initial: Base wait in seconds before the first retry
+        maximum: Upper bound in seconds for a single wait
+
+    Returns:
+        Decorator applying the retry policy
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(attempts):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if attempt == attempts - 1 or not _is_transient(e):
+                        raise
+                    delay = _retry_after(e)
+                    if delay is None:
+                        delay = initial * 2**attempt + random.uniform(0, initial)
+                    delay = min(delay, maximum)
+                    logger.warning(
+                        "%s failed (%s), retrying in %.2fs",
+                        func.__qualname__,
+                        status_code(e) or type(e).__name__,
+                        delay,
+                    )
+                    time.sleep(delay)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,64 @@
+import unittest
+from unittest import mock
+
+import requests
+
+from jira_agent.atlassian.confluence import Client
+
+
+def search_hit(body: str, version: int) -> dict:
+    return {
+        "results": [
+            {
+                "content": {
+                    "id": "1",
+                    "title": "VPN Setup",
+                    "body": {"storage": {"value": body}},
+                    "version": {"number": version},
+                }
+            }
+        ]
+    }
+
+
+class ConfluenceClientTest(unittest.TestCase):
+    def setUp(self):
+        self.client = Client("https://wiki.example.com", "bot@example.com", "token")
+        self.api = mock.Mock()
+        self.client.confluence = self.api
+
+    def test_uncached_lookup_reads_the_current_body(self):
+        self.api.cql.return_value = search_hit("<p>old</p>", 3)
+        self.client.find_page_by_title("VPN Setup", expand_body=True)
+
+        self.api.cql.return_value = search_hit("<p>edited</p>", 4)
+        cached = self.client.find_page_by_title("VPN Setup", expand_body=True)
+        fresh = self.client.find_page_by_title(
+            "VPN Setup", expand_body=True, use_cache=False
+        )
+
+        self.assertEqual(cached["content"], "<p>old</p>")
+        self.assertEqual((fresh["content"], fresh["version"]), ("<p>edited</p>", 4))
+
+    def test_versioned_update_requests_the_next_version(self):
+        self.api.put.return_value = {"id": "1", "title": "VPN Setup"}
+
+        self.client.update_page("1", "VPN Setup", "<p>new</p>", version=4)
+
+        data = self.api.put.call_args.kwargs["data"]
+        self.assertEqual(data["version"]["number"], 5)
+        self.api.update_page.assert_not_called()
+
+    def test_update_is_dropped_on_version_conflict(self):
+        response = requests.Response()
+        response.status_code = 409
+        self.api.put.side_effect = requests.HTTPError("conflict", response=response)
+
+        result = self.client.update_page("1", "VPN Setup", "<p>new</p>", version=4)
+
+        self.assertIsNone(result)
+        self.assertEqual(self.api.put.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
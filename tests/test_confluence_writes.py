@@ -0,0 +1,70 @@
+import json
+import threading
+import time
+import unittest
+
+from jira_agent.core.confluence_handler import ConfluenceHandler
+
+
+class FakeConfluence:
+    """One page whose reads and writes are slow enough to interleave."""
+
+    def __init__(self, title: str, content: str):
+        self.page = {"id": "1", "title": title, "content": content, "version": 1}
+        self.lock = threading.Lock()
+
+    def find_page_by_title(self, title, **kwargs):
+        with self.lock:
+            page = dict(self.page) if title == self.page["title"] else None
+        time.sleep(0.05)
+        return page
+
+    def get_page_content(self, page_id, **kwargs):
+        return self.find_page_by_title(self.page["title"])
+
+    def update_page(self, page_id, title, content, version_comment=None, **kwargs):
+        time.sleep(0.05)
+        with self.lock:
+            self.page = {**self.page, "content": content}
+            self.page["version"] += 1
+            return {"url": "https://wiki.example.com/1"}
+
+    def create_page(self, title, content, **kwargs):
+        raise AssertionError("the article exists")
+
+
+def analysis(changes: str) -> str:
+    return json.dumps(
+        {
+            "needsNewArticle": False,
+            "existingArticleUpdates": [
+                {"articleTitle": "VPN Setup", "suggestedChanges": changes}
+            ],
+        }
+    )
+
+
+class ConcurrentArticleUpdateTest(unittest.TestCase):
+    def test_updates_from_concurrent_tickets_are_all_kept(self):
+        service = FakeConfluence("VPN Setup", "<p>Intro</p>")
+        handler = ConfluenceHandler(service, llm_service=None)
+
+        threads = [
+            threading.Thread(
+                target=handler.submit_analysis,
+                args=(analysis(f"Note from OPS-{n}"), f"OPS-{n}"),
+            )
+            for n in (1, 2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        content = service.page["content"]
+        self.assertIn("Note from OPS-1", content)
+        self.assertIn("Note from OPS-2", content)
+
+
+if __name__ == "__main__":
+    unittest.main()
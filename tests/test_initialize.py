@@ -0,0 +1,38 @@
+import unittest
+from unittest import mock
+
+from jira_agent.core import main
+from jira_agent.core.config import ServiceConfig
+from jira_agent.core.main import JiraAgent
+
+JIRA_ENV = {
+    "JIRA_SERVER": "https://jira.example.com",
+    "JIRA_EMAIL": "agent@example.com",
+    "JIRA_API_TOKEN": "token",
+    "JIRA_PROJECT_KEY": "OPS",
+}
+
+
+class InitializeJiraTest(unittest.TestCase):
+    def setUp(self):
+        main._VERIFIED_CONNECTIONS.clear()
+        self.addCleanup(main._VERIFIED_CONNECTIONS.clear)
+        self.agent = JiraAgent(ServiceConfig.from_env(JIRA_ENV))
+
+    def initialize_with(self, connected: bool) -> bool:
+        with mock.patch("jira_agent.atlassian.jira.Client") as client:
+            client.return_value.test_connection.return_value = connected
+            return self.agent._initialize_jira()
+
+    def test_failed_connection_test_fails_initialization(self):
+        self.assertFalse(self.initialize_with(connected=False))
+        self.assertEqual(main._VERIFIED_CONNECTIONS, {})
+
+    def test_successful_connection_is_remembered(self):
+        self.assertTrue(self.initialize_with(connected=True))
+        # A failing check is skipped while the credentials are still verified
+        self.assertTrue(self.initialize_with(connected=False))
+
+
+if __name__ == "__main__":
+    unittest.main()
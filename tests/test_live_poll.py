@@ -0,0 +1,146 @@
+import time
+import unittest
+from typing import List
+from unittest import mock
+
+from jira_agent.atlassian.jira import ResolvedIssue
+from jira_agent.core.config import ServiceConfig
+from jira_agent.core.main import JiraAgent
+
+
+class FakeJira:
+    """Resolved-ticket search over a fixed backlog, honouring paging."""
+
+    def __init__(self, backlog: List[ResolvedIssue]):
+        self.backlog = backlog
+        self.requests = []
+
+    def fetch_recently_resolved(
+        self, project_key, lookback_minutes, max_results, start_at=0
+    ):
+        self.requests.append((start_at, max_results))
+        return self.backlog[start_at : start_at + max_results]
+
+
+class SlidingWindowJira:
+    """
+    Resolved-ticket search that evaluates "-Nm" against a clock, like JIRA.
+
+    Each request takes seconds_per_request, so a fixed window drops its
+    oldest issues between pages.
+    """
+
+    def __init__(self, backlog, seconds_per_request: float):
+        self.backlog = backlog
+        self.seconds_per_request = seconds_per_request
+        self.clock = 0.0
+
+    def now(self) -> float:
+        return self.clock
+
+    def fetch_recently_resolved(
+        self, project_key, lookback_minutes, max_results, start_at=0
+    ):
+        since = self.clock - lookback_minutes * 60
+        self.clock += self.seconds_per_request
+        window = [
+            ResolvedIssue(key, str(resolved))
+            for key, resolved in self.backlog
+            if resolved >= since
+        ]
+        return window[start_at : start_at + max_results]
+
+
+class ScriptedJira:
+    """Answers each poll with the next scripted list of resolved issues."""
+
+    def __init__(self, polls):
+        self.polls = iter(polls)
+
+    def fetch_recently_resolved(
+        self, project_key, lookback_minutes, max_results, start_at=0
+    ):
+        return next(self.polls)
+
+
+class FakeClock:
+    """Monotonic clock that only moves while the poller sleeps."""
+
+    def __init__(self, sleeps_until_stop: int):
+        self.now = 0.0
+        self.sleeps = []
+        self.sleeps_until_stop = sleeps_until_stop
+
+    def monotonic(self) -> float:
+        return self.now
+
+    # Stands in for the agent's shutdown event
+    def is_set(self) -> bool:
+        return len(self.sleeps) >= self.sleeps_until_stop
+
+    def wait(self, seconds: float) -> bool:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        return self.is_set()
+
+
+class LivePollTest(unittest.TestCase):
+    def make_agent(self, backlog: List[ResolvedIssue]) -> JiraAgent:
+        config = ServiceConfig.from_env(
+            {"JIRA_PROJECT_KEY": "OPS", "JIRA_PAGE_SIZE": "3"}
+        )
+        agent = JiraAgent(config)
+        agent.jira_service = FakeJira(backlog)
+        return agent
+
+    def test_poll_reads_past_a_full_page(self):
+        backlog = [ResolvedIssue(f"OPS-{n}", f"2024-01-0{n}") for n in range(1, 6)]
+        agent = self.make_agent(backlog)
+        processed = []
+
+        def process_batch(pool, keys):
+            processed.extend(keys)
+            agent.stop()
+
+        agent._process_batch = process_batch
+        agent.run_live_mode()
+
+        self.assertEqual(processed, [issue.key for issue in backlog])
+        self.assertEqual(agent.jira_service.requests, [(0, 3), (3, 3)])
+
+    def test_interval_backs_off_when_idle_and_resets_when_busy(self):
+        found = [ResolvedIssue("OPS-1", "2024-01-01")]
+        agent = self.make_agent([])
+        agent.jira_service = ScriptedJira([[], [], found, [], []])
+        agent._process_batch = lambda pool, keys: None
+        clock = FakeClock(sleeps_until_stop=5)
+        agent._shutdown = clock
+
+        with mock.patch("jira_agent.core.main.time.monotonic", clock.monotonic):
+            agent.run_live_mode()
+
+        # POLL_INTERVAL_SECONDS defaults to 30 and grows by 1.5x per idle poll
+        self.assertEqual(clock.sleeps, [45, 67.5, 30, 45, 67.5])
+
+    def test_poll_of_exactly_one_page_checks_for_more(self):
+        backlog = [ResolvedIssue(f"OPS-{n}", f"2024-01-0{n}") for n in range(1, 4)]
+        agent = self.make_agent(backlog)
+
+        self.assertEqual(agent._fetch_resolved(5, time.monotonic()), backlog)
+        self.assertEqual(agent.jira_service.requests, [(0, 3), (3, 3)])
+
+    def test_issues_leaving_a_relative_window_do_not_shift_pages(self):
+        # Resolved 10..4 minutes before the poll, oldest first
+        backlog = [(f"OPS-{n}", -600 + 60 * n) for n in range(7)]
+        jira = SlidingWindowJira(backlog, seconds_per_request=90)
+        agent = self.make_agent([])
+        agent.jira_service = jira
+
+        with mock.patch("jira_agent.core.main.time.monotonic", jira.now):
+            issues = agent._fetch_resolved(10, poll_started=0)
+
+        self.assertEqual([issue.key for issue in issues], [k for k, _ in backlog])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from jira_agent.agent.llm import OpenAIProvider
+
+
+class ChatCompletionStub(BaseHTTPRequestHandler):
+    """Minimal /chat/completions endpoint echoing the last user message."""
+
+    protocol_version = "HTTP/1.1"
+    requests_seen = 0
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        type(self).requests_seen += 1
+        body = json.dumps(
+            {
+                "id": "chatcmpl-1",
+                "object": "chat.completion",
+                "created": 0,
+                "model": request["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {
+                            "role": "assistant",
+                            "content": request["messages"][-1]["content"].upper(),
+                        },
+                    }
+                ],
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class OpenAIBatchTest(unittest.TestCase):
+    def setUp(self):
+        ChatCompletionStub.requests_seen = 0
+        server = ThreadingHTTPServer(("127.0.0.1", 0), ChatCompletionStub)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.provider = OpenAIProvider(
+            api_key="test",
+            base_url=f"http://127.0.0.1:{server.server_port}/v1",
+            model="stub",
+        )
+
+    def test_consecutive_batches_need_no_retries(self):
+        for _ in range(3):
+            self.assertEqual(self.provider.generate_batch(["a", "b"]), ["A", "B"])
+
+        # A client reused across event loops fails on its pooled connections
+        # and only succeeds through the SDK's retries, which the stub counts
+        self.assertEqual(ChatCompletionStub.requests_seen, 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from jira_agent.agent.llm import LLM, LLMProvider
+from jira_agent.agent.llm_cache import LLMCache
+from jira_agent.utils.cache import DiskBackend
+
+
+class CountingProvider(LLMProvider):
+    """Provider that answers with a counter, sampling at whatever it is sent."""
+
+    model = "counting"
+
+    def __init__(self):
+        self.calls = []
+
+    def effective_temperature(self, **kwargs):
+        return kwargs.get("temperature")
+
+    def generate_response(self, prompt, **kwargs):
+        self.calls.append(kwargs)
+        return f"response {len(self.calls)}"
+
+
+class LLMCacheTest(unittest.TestCase):
+    def test_repeated_prompt_is_served_from_cache(self):
+        provider = CountingProvider()
+        llm = LLM(provider, cache=LLMCache())
+        prompt = [{"role": "user", "content": "Summarize OPS-1"}]
+
+        first = llm.generate_response(prompt, **llm.deterministic_kwargs)
+        second = llm.generate_response(prompt, **llm.deterministic_kwargs)
+
+        self.assertEqual(first, second)
+        self.assertEqual(provider.calls, [{"temperature": 0}])
+
+    def test_unknown_temperature_is_not_cached(self):
+        provider = CountingProvider()
+        llm = LLM(provider, cache=LLMCache())
+
+        llm.generate_response("prompt")
+        llm.generate_response("prompt")
+
+        self.assertEqual(len(provider.calls), 2)
+
+    def test_no_cache_keeps_provider_default(self):
+        self.assertEqual(LLM(CountingProvider()).deterministic_kwargs, {})
+
+
+class DiskLLMCacheTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "llm_cache.sqlite3")
+
+    def make_llm(self, provider, ttl=None):
+        return LLM(provider, cache=LLMCache(DiskBackend(self.path), ttl=ttl))
+
+    def test_response_is_reused_by_a_later_run(self):
+        first_run, second_run = CountingProvider(), CountingProvider()
+
+        first = self.make_llm(first_run)
+        answer = first.generate_response("prompt", **first.deterministic_kwargs)
+        second = self.make_llm(second_run)
+
+        self.assertEqual(
+            second.generate_response("prompt", **second.deterministic_kwargs), answer
+        )
+        self.assertEqual(second_run.calls, [])
+
+    def test_expired_response_is_generated_again(self):
+        first = self.make_llm(CountingProvider(), ttl=60)
+        first.generate_response("prompt", **first.deterministic_kwargs)
+
+        provider = CountingProvider()
+        second = self.make_llm(provider, ttl=60)
+        later = time.time() + 61
+        with mock.patch("jira_agent.utils.cache.time.time", return_value=later):
+            second.generate_response("prompt", **second.deterministic_kwargs)
+
+        self.assertEqual(len(provider.calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
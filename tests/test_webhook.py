@@ -0,0 +1,111 @@
+import hashlib
+import hmac
+import json
+import queue
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from unittest import mock
+
+from jira_agent.core.webhook import WEBHOOK_PATH, make_server, resolved_issue
+
+SECRET = "s3cret"
+
+
+def event(key="OPS-1", project="OPS", resolutiondate="2024-01-01T10:00:00.000+0000"):
+    return {
+        "webhookEvent": "jira:issue_updated",
+        "issue": {
+            "key": key,
+            "fields": {"project": {"key": project}, "resolutiondate": resolutiondate},
+        },
+    }
+
+
+def sign(body: bytes, secret: str = SECRET) -> str:
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+class ResolvedIssueTest(unittest.TestCase):
+    def test_resolved_issue_of_the_project_is_accepted(self):
+        self.assertEqual(resolved_issue(event(), "OPS")["key"], "OPS-1")
+
+    def test_unresolved_issue_is_ignored(self):
+        self.assertIsNone(resolved_issue(event(resolutiondate=None), "OPS"))
+
+    def test_issue_of_another_project_is_ignored(self):
+        self.assertIsNone(resolved_issue(event(project="HR"), "OPS"))
+
+    def test_payload_without_issue_is_ignored(self):
+        self.assertIsNone(resolved_issue({"webhookEvent": "jira:issue_deleted"}))
+        self.assertIsNone(resolved_issue(["not", "an", "object"]))
+
+
+class WebhookServerTest(unittest.TestCase):
+    def setUp(self):
+        self.issues = queue.Queue()
+        server = make_server(
+            "127.0.0.1", 0, self.issues.put, secret=SECRET, project_key="OPS"
+        )
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.url = f"http://127.0.0.1:{server.server_port}{WEBHOOK_PATH}"
+
+    def post(self, body: bytes, signature=None) -> int:
+        request = urllib.request.Request(self.url, data=body, method="POST")
+        if signature is not None:
+            request.add_header("X-Hub-Signature", signature)
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+
+    def test_signed_resolved_issue_is_accepted(self):
+        body = json.dumps(event()).encode()
+
+        self.assertEqual(self.post(body, sign(body)), 202)
+        self.assertEqual(self.issues.get(timeout=5)["key"], "OPS-1")
+
+    def test_missing_signature_is_rejected(self):
+        self.assertEqual(self.post(json.dumps(event()).encode()), 401)
+
+    def test_wrong_signature_is_rejected(self):
+        body = json.dumps(event()).encode()
+
+        self.assertEqual(self.post(body, sign(body, "other")), 401)
+
+    def test_oversized_payload_is_rejected(self):
+        body = json.dumps(event()).encode()
+
+        with mock.patch("jira_agent.core.webhook.MAX_PAYLOAD_BYTES", len(body) - 1):
+            self.assertEqual(self.post(body, sign(body)), 400)
+
+    def test_rejected_and_filtered_requests_queue_nothing(self):
+        unresolved = json.dumps(event(resolutiondate=None)).encode()
+        other_project = json.dumps(event(project="HR")).encode()
+
+        self.post(json.dumps(event()).encode(), sign(b"tampered"))
+        self.assertEqual(self.post(unresolved, sign(unresolved)), 202)
+        self.assertEqual(self.post(other_project, sign(other_project)), 202)
+
+        # The next accepted event is the first one to reach the callback
+        body = json.dumps(event(key="OPS-2")).encode()
+        self.post(body, sign(body))
+        self.assertEqual(self.issues.get(timeout=5)["key"], "OPS-2")
+
+
+class ListenAddressTest(unittest.TestCase):
+    def test_public_address_requires_a_secret(self):
+        with self.assertRaises(ValueError):
+            make_server("0.0.0.0", 0, lambda issue: None)
+
+    def test_loopback_address_may_run_unsigned(self):
+        server = make_server("127.0.0.1", 0, lambda issue: None)
+        server.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()